@@ -1,3 +1,4 @@
+import os
 import sys
 import logging
 from pathlib import Path
@@ -9,6 +10,7 @@ __all__ = [
     'DATE_FMT_ACCOUNT', 'DATE_FMT_YNAB',
     'SUPPORTED_EXT',
     'get_settings', 'SETTINGS_DIR', 'SETTINGS_FILE', 'KEY_FILE', 'ACTUAL_SETTINGS_FILE',
+    'CACHE_DIR', 'write_private_file',
     'get_logger',
     'DUP_CHECK_DAYS', 'DUP_CHECK_COUNT',
 ]
@@ -27,6 +29,8 @@ SETTINGS_DIR = Path.home() / f".{APP_NAME}"
 SETTINGS_FILE = str(SETTINGS_DIR / "settings.txt")
 KEY_FILE = str(SETTINGS_DIR / "settings.key")
 ACTUAL_SETTINGS_FILE = str(SETTINGS_DIR / "actual_settings.txt")
+# Derived data that can be rebuilt at any time (e.g., compacted stylesheet)
+CACHE_DIR = SETTINGS_DIR / "cache"
 
 
 def ensure_app_dir() -> None:
@@ -34,6 +38,32 @@ def ensure_app_dir() -> None:
     SETTINGS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def write_private_file(path, text: str) -> None:
+    """Atomically replace path with text, readable only by the owner (0o600).
+
+    The content goes to a sibling temp file in a single write() and is fsynced before
+    being renamed over path, so readers never see a partially written file.
+    """
+    path = str(path)
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        try:
+            data = memoryview(text.encode("utf-8"))
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def get_settings() -> QSettings:
     """Return a QSettings instance, creating directories on first use."""
     ensure_app_dir()
@@ -62,6 +62,19 @@ def write_output(
     return out_path
 
 
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """Parse a date column, vectorized for the YNAB format the converters emit.
+
+    Only values that are not YYYY-MM-DD fall back to pandas' format inference;
+    unparseable values become NaT.
+    """
+    parsed = pd.to_datetime(values, format=DATE_FMT_YNAB, errors='coerce')
+    missing = parsed.isna() & values.notna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(values[missing], errors='coerce')
+    return parsed
+
+
 def exclude_existing(
     new_df: pd.DataFrame,
     prev_df: pd.DataFrame,
@@ -85,8 +98,8 @@ def exclude_existing(
     new_copy = new_df.copy()
     prev_copy = prev_df.copy()
 
-    new_copy['Date'] = pd.to_datetime(new_copy['Date'], errors='coerce')
-    prev_copy['Date'] = pd.to_datetime(prev_copy['Date'], errors='coerce')
+    new_copy['Date'] = _parse_dates(new_copy['Date'])
+    prev_copy['Date'] = _parse_dates(prev_copy['Date'])
 
     if drop_older_than_latest_prev:
         latest_prev_date = prev_copy['Date'].max()
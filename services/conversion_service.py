@@ -79,6 +79,42 @@ def _load_input_dataframe(input_file: str) -> pd.DataFrame:
     return read_input(Path(input_file))
 
 
+# ((path, mtime_ns, size), (processed DataFrame, is_revolut, source)) of the last
+# parsed input, so revisiting the review step does not re-read the same file.
+# The key covers only the file itself: a different processor (or a rewrite that keeps
+# mtime and size) is not noticed until _clear_processed_cache() is called.
+_last_processed = None
+
+
+def _clear_processed_cache() -> None:
+    """Forget the cached processed input so the next conversion re-reads the file."""
+    global _last_processed
+    _last_processed = None
+
+
+def _process_input(input_file: str):
+    """Read and process input_file; returns (DataFrame, is_revolut, source).
+
+    The result for an unchanged file (same path, mtime and size; nothing else is
+    part of the key) is reused and handed out as a copy, so callers are free to
+    modify it.
+    """
+    global _last_processed
+    st = os.stat(input_file)
+    key = (os.path.abspath(input_file), st.st_mtime_ns, st.st_size)
+    cached = _last_processed
+    if cached is not None and cached[0] == key:
+        df, is_revolut, source = cached[1]
+        logging.debug("Reusing processed %s input for %s", source, input_file)
+        return df.copy(), is_revolut, source
+    df = _load_input_dataframe(input_file)
+    processor, is_revolut, source = detect_processor(df, PROCESSOR_MAP)
+    logging.info("Processing as %s", source)
+    processed = processor(df)
+    _last_processed = (key, (processed, is_revolut, source))
+    return processed.copy(), is_revolut, source
+
+
 def generate_output_filename(
     input_file: str,
     is_revolut: bool = False,
@@ -153,10 +189,7 @@ class ConversionService:
         output_dir: Optional[str] = None,
     ) -> pd.DataFrame:
         validate_input_file(input_file)
-        df = _load_input_dataframe(input_file)
-        processor, is_revolut, source = detect_processor(df, PROCESSOR_MAP)
-        logging.info("Processing as %s", source)
-        ynab_df = processor(df)
+        ynab_df, is_revolut, _ = _process_input(input_file)
         if previous_ynab:
             prev_df = load_previous_transactions(previous_ynab)
             ynab_df = exclude_existing_transactions(ynab_df, prev_df)
@@ -180,10 +213,8 @@ class ConversionService:
         Amount is negative for outflow, positive for inflow.
         """
         validate_input_file(input_file)
-        df = _load_input_dataframe(input_file)
-        processor, is_revolut, source = detect_processor(df, PROCESSOR_MAP)
-        logging.info("Processing as %s for Actual export", source)
-        base_df = processor(df)
+        base_df, is_revolut, source = _process_input(input_file)
+        logging.info("Exporting %s input for Actual", source)
         if previous_ynab:
             prev_df = load_previous_transactions(previous_ynab)
             prev_df = _normalize_prev_df_for_dedup(prev_df)
@@ -1,10 +1,14 @@
 from cryptography.fernet import Fernet
 from pathlib import Path
+import functools
 import os
-from config import KEY_FILE, SETTINGS_FILE, get_logger
+from config import KEY_FILE, SETTINGS_FILE, get_logger, write_private_file
 
 logger = get_logger(__name__)
 
+# KEY_FILE path -> key bytes, so the key file is read once per process
+_KEY_CACHE = {}
+
 
 def generate_key() -> bytes:
     """Generate a new encryption key."""
@@ -17,14 +21,24 @@ def save_key(key: bytes) -> None:
     key_path.parent.mkdir(parents=True, exist_ok=True)
     key_path.write_bytes(key)
     os.chmod(key_path, 0o600)  # Secure permissions
+    _KEY_CACHE[str(KEY_FILE)] = key
 
 
 def load_key() -> bytes:
     """Load encryption key from file."""
-    key_path = Path(KEY_FILE)
-    if not key_path.exists():
-        raise FileNotFoundError(f"Encryption key not found: {KEY_FILE}")
-    return key_path.read_bytes()
+    key = _KEY_CACHE.get(str(KEY_FILE))
+    if key is None:
+        key_path = Path(KEY_FILE)
+        if not key_path.exists():
+            raise FileNotFoundError(f"Encryption key not found: {KEY_FILE}")
+        key = _KEY_CACHE[str(KEY_FILE)] = key_path.read_bytes()
+    return key
+
+
+@functools.lru_cache(maxsize=None)
+def _fernet(key: bytes) -> Fernet:
+    """Fernet for key, built once per key rather than per token."""
+    return Fernet(key)
 
 
 def encrypt_token(token: str) -> bytes:
@@ -35,15 +49,12 @@ def encrypt_token(token: str) -> bytes:
         logger.info("Generating new encryption key")
         key = generate_key()
         save_key(key)
-    f = Fernet(key)
-    return f.encrypt(token.encode())
+    return _fernet(key).encrypt(token.encode())
 
 
 def decrypt_token(token_bytes: bytes) -> str:
     """Decrypt a token using the stored key."""
-    key = load_key()
-    f = Fernet(key)
-    return f.decrypt(token_bytes).decode()
+    return _fernet(load_key()).decrypt(token_bytes).decode()
 
 
 def save_token(token: str) -> None:
@@ -70,8 +81,7 @@ def save_token(token: str) -> None:
         lines = []
 
     lines.insert(0, f"TOKEN:{encrypted_token}")
-    token_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-    os.chmod(token_path, 0o600)  # Secure permissions
+    write_private_file(token_path, "\n".join(lines) + "\n")
     logger.info("Token saved securely")
 
 
@@ -52,14 +52,17 @@ class YnabClient:
     BASE_URL = "https://api.ynab.com/v1"
 
     def __init__(self, token: str):
+        self.token = token
         self.headers = {"Authorization": f"Bearer {token}"}
+        # One session per client so every call reuses the pooled TLS connection
+        self._session = requests.Session()
         # Cache accounts per budget to avoid repeated API calls
         self._accounts_cache = {}
 
     def get_budgets(self) -> list:
         """Fetch list of budgets."""
         url = f"{self.BASE_URL}/budgets"
-        resp = requests.get(url, headers=self.headers, timeout=10)
+        resp = self._session.get(url, headers=self.headers, timeout=10)
         self._log_api('GET', url, resp)
         resp.raise_for_status()
         return resp.json()['data']['budgets']
@@ -67,7 +70,7 @@ class YnabClient:
     def get_accounts(self, budget_id: str) -> list:
         """Fetch list of accounts for a budget."""
         url = f"{self.BASE_URL}/budgets/{budget_id}/accounts"
-        resp = requests.get(url, headers=self.headers, timeout=10)
+        resp = self._session.get(url, headers=self.headers, timeout=10)
         self._log_api('GET', url, resp)
         resp.raise_for_status()
         return resp.json()['data']['accounts']
@@ -92,7 +95,7 @@ class YnabClient:
             params['page'] = page
         if since_date is not None:
             params['since_date'] = since_date
-        resp = requests.get(
+        resp = self._session.get(
             url,
             headers=self.headers,
             params=params,
@@ -116,7 +119,7 @@ class YnabClient:
         """Upload new transactions to a budget."""
         url = f"{self.BASE_URL}/budgets/{budget_id}/transactions"
         data = {"transactions": transactions}
-        resp = requests.post(
+        resp = self._session.post(
             url,
             headers={**self.headers, "Content-Type": "application/json"},
             json=data,
@@ -1,5 +1,18 @@
 import sys
 import os
+import pytest
 
 # Add the parent directory to the path so imports work correctly
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _icon_cache_dir(tmp_path_factory):
+    """Keep rendered icon PNGs out of the real app cache dir while pages are built."""
+    from ui import icons
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(icons, "ICON_CACHE_DIR", str(tmp_path_factory.mktemp("icons")))
+        icons._dir_index.cache_clear()
+        yield
+    icons._dir_index.cache_clear()
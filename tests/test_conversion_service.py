@@ -19,6 +19,7 @@ from services.conversion_service import (
     validate_input_file,
     generate_actual_output_filename,
     ConversionService,
+    _clear_processed_cache,
 )
 
 
@@ -541,6 +542,9 @@ class TestTransactionExclusion(unittest.TestCase):
 class TestActualConversion(unittest.TestCase):
     """Tests for Actual Budget export behavior."""
 
+    def setUp(self):
+        _clear_processed_cache()
+
     def test_generate_actual_output_filename_uses_settings_dir(self):
         with tempfile.TemporaryDirectory() as td:
             settings_dir = Path(td) / "settings"
@@ -650,5 +654,42 @@ class TestActualConversion(unittest.TestCase):
             self.assertEqual(len(output_df), 1)
 
 
+class TestProcessedInputCache(unittest.TestCase):
+    """Repeated conversions of an unchanged file reuse the parsed result."""
+
+    def setUp(self):
+        _clear_processed_cache()
+
+    def test_unchanged_file_is_parsed_once(self):
+        base_df = pd.DataFrame({
+            'Date': ['2025-07-01'],
+            'Payee': ['Coffee Shop'],
+            'Memo': ['Coffee'],
+            'Amount': [-4.50],
+        })
+
+        with tempfile.TemporaryDirectory() as td:
+            input_path = Path(td) / "input.csv"
+            pd.DataFrame({'A': [1]}).to_csv(input_path, index=False)
+
+            def fake_processor(_df):
+                return base_df.copy()
+
+            with patch('services.conversion_service.detect_processor',
+                       return_value=(fake_processor, False, 'mock')):
+                with patch('services.conversion_service.read_input',
+                           return_value=pd.DataFrame({'A': [1]})) as mock_read:
+                    first = ConversionService.convert_to_ynab(str(input_path), write_output=False)
+                    first.loc[0, 'Payee'] = 'changed by caller'
+                    second = ConversionService.convert_to_ynab(str(input_path), write_output=False)
+                    self.assertEqual(mock_read.call_count, 1)
+                    self.assertEqual(second.loc[0, 'Payee'], 'Coffee Shop')
+
+                    # A modified file is read again
+                    pd.DataFrame({'A': [1, 2]}).to_csv(input_path, index=False)
+                    ConversionService.convert_to_ynab(str(input_path), write_output=False)
+                    self.assertEqual(mock_read.call_count, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -88,7 +88,7 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(pd.errors.ParserError):
             pd.read_csv(self.temp_file.name)
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_timeout(self, mock_get):
         """Test handling of API timeout."""
         # Set up timeout exception
@@ -100,7 +100,7 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(requests.exceptions.Timeout):
             client.get_budgets()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_connection_error(self, mock_get):
         """Test handling of connection error."""
         # Set up connection error
@@ -114,7 +114,7 @@ class TestErrorHandling(unittest.TestCase):
         with self.assertRaises(requests.exceptions.ConnectionError):
             client.get_budgets()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_unauthorized(self, mock_get):
         """Test handling of unauthorized API access."""
         # Set up mock response for unauthorized error
@@ -1,11 +1,16 @@
 # flake8: noqa
+import io
+import logging
 import os
 import tempfile
 import unittest
 import pandas as pd
 from datetime import datetime
+from logging.handlers import QueueHandler
 from PyQt5.QtWidgets import QApplication
-from ui.wizard import StepLabel, load_style
+from unittest.mock import patch
+from ui import wizard
+from ui.wizard import StepLabel, load_style, load_palette, apply_stylesheet
 from main import (
     convert_amount,
     extract_date_from_filename,
@@ -332,11 +337,114 @@ class TestUIComponents(unittest.TestCase):
     def setUpClass(cls):
         os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
         cls.app = QApplication.instance() or QApplication([])
+        # Keep the compacted-QSS sidecar out of the real app cache dir
+        cls._cache_dir = tempfile.TemporaryDirectory()
+        cls._cache_patch = patch.object(
+            wizard, "_style_cache_path", return_value=os.path.join(cls._cache_dir.name, "style.qss.cache")
+        )
+        cls._cache_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._cache_patch.stop()
+        cls._cache_dir.cleanup()
 
     def test_load_style_applies_stylesheet(self):
         load_style(self.app)
         self.assertTrue(self.app.styleSheet())
 
+    def test_load_palette_leaves_stylesheet_for_later(self):
+        self.app.setStyleSheet("")
+        load_palette(self.app)
+        self.assertFalse(self.app.styleSheet())
+        apply_stylesheet(self.app)
+        self.assertTrue(self.app.styleSheet())
+
+    def test_step_labels_keep_their_border_under_the_app_stylesheet(self):
+        apply_stylesheet(self.app)
+        with patch.object(wizard, "WizardController"):
+            window = wizard.SidebarWizardWindow()
+            window.show()
+            self.app.processEvents()
+            # 4px border-left plus 16px padding from the sidebar step rules in style.qss
+            self.assertEqual(window.step_labels[0].contentsRect().left(), 20)
+            window.close()
+
+    def test_load_palette_skip_cosmetics_sets_font_only(self):
+        with patch.object(self.app, "setWindowIcon") as set_icon, \
+                patch.object(self.app, "setStyle") as set_style, \
+                patch.object(self.app, "setPalette") as set_palette:
+            load_palette(self.app, skip_cosmetics=True)
+        set_icon.assert_not_called()
+        set_style.assert_not_called()
+        set_palette.assert_not_called()
+        self.assertEqual(self.app.font(), wizard._default_font())
+
+    def test_root_logging_goes_through_queue(self):
+        root = logging.getLogger()
+        saved_handlers = root.handlers[:]
+        stream = io.StringIO()
+        root.handlers = [logging.StreamHandler(stream)]
+        try:
+            listener = wizard._queue_root_logging()
+            self.assertEqual([type(h) for h in root.handlers], [QueueHandler])
+            root.warning("queued record")
+            listener.stop()
+        finally:
+            root.handlers = saved_handlers
+        self.assertIn("queued record", stream.getvalue())
+
+    def test_main_flushes_log_queue_on_startup_error(self):
+        root = logging.getLogger()
+        saved_handlers = root.handlers[:]
+        stream = io.StringIO()
+        root.handlers = [logging.StreamHandler(stream)]
+        try:
+            with patch.object(wizard.logging, "basicConfig"), \
+                    patch.object(wizard, "QApplication") as mock_app_cls:
+                mock_app_cls.side_effect = RuntimeError("no display")
+                wizard.main()
+        finally:
+            root.handlers = saved_handlers
+        # The queued crash record (with its traceback) is written before main() returns
+        self.assertIn("[Main] Exception in main(): no display", stream.getvalue())
+        self.assertIn("RuntimeError: no display", stream.getvalue())
+
+    def test_compact_qss_strips_comments_and_whitespace(self):
+        qss = "/* header */\nQLabel {\n    color: #222;\n    font-size: 15px;\n}\n\n#nav-separator { border: none; }\n"
+        self.assertEqual(
+            wizard._compact_qss(qss),
+            "QLabel{color: #222;font-size: 15px;}#nav-separator{border: none;}",
+        )
+
+    def test_style_cache_sidecar_reused_until_source_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "style.qss.cache")
+            with patch.object(wizard, "_style_cache_path", return_value=cache_path), \
+                    patch.object(wizard, "_STYLE_CACHE", None):
+                text = wizard._read_style()
+                self.assertTrue(os.path.exists(cache_path))
+                with open(cache_path, encoding="utf-8") as f:
+                    self.assertEqual(f.read().split("\n", 1)[1], text)
+
+                # A fresh process (empty memory cache) serves the sidecar without re-reading the source
+                wizard._STYLE_CACHE = None
+                with patch.object(wizard, "_read_qss_source") as mock_read:
+                    self.assertEqual(wizard._read_style(), text)
+                    mock_read.assert_not_called()
+
+    def test_style_cache_sidecar_ignored_after_format_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = os.path.join(tmpdir, "style.qss.cache")
+            with patch.object(wizard, "_style_cache_path", return_value=cache_path), \
+                    patch.object(wizard, "_STYLE_CACHE", None):
+                text = wizard._read_style()
+                wizard._STYLE_CACHE = None
+                with patch.object(wizard, "_STYLE_CACHE_VERSION", wizard._STYLE_CACHE_VERSION + 1), \
+                        patch.object(wizard, "_read_qss_source", wraps=wizard._read_qss_source) as mock_read:
+                    self.assertEqual(wizard._read_style(), text)
+                    mock_read.assert_called_once()
+
 
 class TestValidateInputFile(unittest.TestCase):
     def test_validate_input_file_success(self):
@@ -97,6 +97,25 @@ class TestTokenManager(unittest.TestCase):
         finally:
             services.token_manager.KEY_FILE = original_key_file
 
+    def test_load_key_reads_file_once(self):
+        """The key is read from disk once and reused for every token."""
+        original_key_file = services.token_manager.KEY_FILE
+        test_key_path = os.path.join(self.test_dir, "cached.key")
+        services.token_manager.KEY_FILE = test_key_path
+
+        try:
+            key = generate_key()
+            with open(test_key_path, "wb") as f:
+                f.write(key)
+            self.assertEqual(load_key(), key)
+
+            # A later read must come from the cache, not the (now removed) file
+            os.remove(test_key_path)
+            self.assertEqual(load_key(), key)
+            self.assertEqual(decrypt_token(encrypt_token("abc")), "abc")
+        finally:
+            services.token_manager.KEY_FILE = original_key_file
+
     def test_save_load_token(self):
         """Test token encryption and decryption functionality."""
         # Mock paths
@@ -129,6 +148,31 @@ class TestTokenManager(unittest.TestCase):
             services.token_manager.KEY_FILE = original_key_file
             services.token_manager.SETTINGS_FILE = original_settings_file
 
+    def test_save_token_replaces_file_atomically(self):
+        """save_token keeps other settings lines and leaves no temp file behind."""
+        original_key_file = services.token_manager.KEY_FILE
+        original_settings_file = services.token_manager.SETTINGS_FILE
+        test_settings_path = os.path.join(self.test_dir, "settings.txt")
+        services.token_manager.KEY_FILE = os.path.join(self.test_dir, "atomic.key")
+        services.token_manager.SETTINGS_FILE = test_settings_path
+
+        try:
+            with open(test_settings_path, "w", encoding="utf-8") as f:
+                f.write("TOKEN:old\nFOLDER:/tmp\n")
+
+            save_token("new_token")
+
+            with open(test_settings_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+            self.assertTrue(lines[0].startswith("TOKEN:"))
+            self.assertEqual(lines[1:], ["FOLDER:/tmp"])
+            self.assertEqual(os.stat(test_settings_path).st_mode & 0o777, 0o600)
+            self.assertEqual(sorted(os.listdir(self.test_dir)), ["atomic.key", "settings.txt"])
+            self.assertEqual(load_token(), "new_token")
+        finally:
+            services.token_manager.KEY_FILE = original_key_file
+            services.token_manager.SETTINGS_FILE = original_settings_file
+
     def test_load_token_missing_file(self):
         """Test error handling for file operations."""
         # Mock the settings file path
@@ -7,12 +7,14 @@ import os
 import tempfile
 
 from services.actual_client import ActualClient
+from services.conversion_service import _clear_processed_cache
 from ui.controller import (
     BudgetFetchWorker,
     AccountFetchWorker,
     TransactionFetchWorker,
     DuplicateCheckWorker,
-    UploadWorker
+    UploadWorker,
+    WizardController,
 )
 
 
@@ -213,6 +215,7 @@ class TestDuplicateCheckWorker(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        _clear_processed_cache()
         self.mock_converter = MagicMock()
         self.mock_ynab_client = MagicMock()
         self.budget_id = "test_budget_id"
@@ -295,6 +298,28 @@ class TestDuplicateCheckWorker(unittest.TestCase):
         self.assertEqual(len(self.finished_signal_duplicates), 0)  # No duplicates
         self.assertIsNone(self.error_signal_message)
 
+    def test_fetch_overlaps_conversion(self):
+        """The transaction fetch runs while the file is being converted."""
+        import threading
+        fetched = threading.Event()
+
+        def fetch(*args, **kwargs):
+            fetched.set()
+            return []
+
+        def convert(*args, **kwargs):
+            # Only completes if the fetch was started concurrently
+            self.assertTrue(fetched.wait(5))
+            return pd.DataFrame({'Date': ['2025-07-01'], 'Payee': ['Shop'], 'Memo': [''], 'Amount': [-1.0]})
+
+        self.mock_ynab_client.get_transactions.side_effect = fetch
+        self.mock_converter.convert_to_ynab.side_effect = convert
+
+        self.worker.run()
+
+        self.assertIsNone(self.error_signal_message)
+        self.assertEqual(len(self.finished_signal_records), 1)
+
     def test_run_success_with_duplicates(self):
         """Test successful duplicate check with duplicates."""
         # Prepare mock data
@@ -325,6 +350,24 @@ class TestDuplicateCheckWorker(unittest.TestCase):
         self.assertTrue(0 in self.finished_signal_duplicates)  # First record is duplicate
         self.assertIsNone(self.error_signal_message)
 
+    def test_run_matches_text_amounts_and_skips_unparseable(self):
+        """Amounts given as text still match; unparseable amounts never do."""
+        mock_df = pd.DataFrame({
+            'Date': ['2025-07-01', '2025-07-01'],
+            'Payee': ['Coffee Shop', 'Coffee Shop'],
+            'Memo': ['Coffee', 'Coffee'],
+            'Amount': [' -4.50 ', 'n/a'],
+        })
+        self.mock_converter.convert_to_ynab.return_value = mock_df
+        self.mock_ynab_client.get_transactions.return_value = [
+            {"date": "2025-07-01", "payee_name": "Coffee Shop", "memo": "Coffee", "amount": -4500}
+        ]
+
+        self.worker.run()
+
+        self.assertEqual(self.finished_signal_duplicates, {0})
+        self.assertIsNone(self.error_signal_message)
+
     def test_run_success_with_actual_import_id_duplicates(self):
         """Test duplicate check using import_id for Actual Budget."""
         class DummyActualClient(ActualClient):
@@ -561,5 +604,40 @@ class TestUploadWorker(unittest.TestCase):
         self.assertEqual(self.finished_signal_count, 1)
 
 
+
+class TestWizardControllerShutdown(unittest.TestCase):
+    """Test WizardController.shutdown."""
+
+    def test_shutdown_stops_running_thread(self):
+        controller = WizardController()
+        thread = MagicMock()
+        thread.isRunning.return_value = True
+        thread.wait.return_value = True
+        controller.worker = MagicMock()
+        controller.worker_thread = thread
+
+        controller.shutdown()
+
+        thread.quit.assert_called_once_with()
+        thread.wait.assert_called_once_with(3000)
+        thread.terminate.assert_not_called()
+        self.assertIsNone(controller.worker_thread)
+        self.assertIsNone(controller.worker)
+
+
+
+class TestWizardControllerAuthorize(unittest.TestCase):
+    """Test WizardController.authorize client reuse."""
+
+    def test_same_token_keeps_client(self):
+        controller = WizardController()
+        self.assertTrue(controller.authorize("token-a", False))
+        client = controller.ynab
+        self.assertTrue(controller.authorize("token-a", False))
+        self.assertIs(controller.ynab, client)
+        self.assertTrue(controller.authorize("token-b", False))
+        self.assertIsNot(controller.ynab, client)
+        self.assertEqual(controller.ynab.token, "token-b")
+
 if __name__ == '__main__':
     unittest.main()
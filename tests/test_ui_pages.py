@@ -5,13 +5,14 @@ import tempfile
 from unittest.mock import MagicMock, patch
 from PyQt5.QtWidgets import QApplication, QWizard, QFrame, QVBoxLayout
 from PyQt5.QtCore import Qt, QMimeData, QUrl, QPoint
-from PyQt5.QtGui import QDragEnterEvent, QDropEvent
+from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QPixmap, QPixmapCache
 from PyQt5.QtTest import QTest
 
 from ui.pages.import_file import ImportFilePage, DropZone
 from ui.pages.auth import YNABAuthPage
 from ui.pages.account_select import AccountSelectionPage
 from ui.pages.review_upload import ReviewAndUploadPage
+from ui import icons
 
 # Create QApplication instance for UI tests
 app = QApplication.instance()
@@ -19,6 +20,91 @@ if not app:
     app = QApplication(sys.argv)
 
 
+class TestSvgPixmap(unittest.TestCase):
+    """Test the cached SVG rasterization helper in ui/icons.py."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.svg_path = os.path.join(icons.ICON_DIR, "success.svg")
+        QPixmapCache.clear()
+        icons._dir_index.cache_clear()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_renders_and_reuses_png_cache(self):
+        with patch.object(icons, "ICON_CACHE_DIR", self.tmpdir.name):
+            pixmap = icons.svg_pixmap(self.svg_path, 24, 24)
+            self.assertFalse(pixmap.isNull())
+            self.assertEqual((pixmap.width(), pixmap.height()), (24, 24))
+            self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, "success_24x24.png")))
+
+            # New process: memory cache empty, PNG on disk is reused
+            QPixmapCache.clear()
+            with patch.object(icons, "_render_svg") as mock_render:
+                cached = icons.svg_pixmap(self.svg_path, 24, 24)
+                mock_render.assert_not_called()
+            self.assertEqual(cached.size(), pixmap.size())
+
+    def test_pixmap_reused_in_memory(self):
+        with patch.object(icons, "ICON_CACHE_DIR", self.tmpdir.name):
+            first = icons.svg_pixmap(self.svg_path, 24, 24)
+            with patch.object(icons, "_load_pixmap") as mock_load:
+                second = icons.svg_pixmap(self.svg_path, 24, 24)
+                mock_load.assert_not_called()
+            self.assertEqual(first.cacheKey(), second.cacheKey())
+
+    def test_hidpi_renders_at_device_pixel_ratio(self):
+        with patch.object(icons, "ICON_CACHE_DIR", self.tmpdir.name), \
+                patch.object(icons, "_device_pixel_ratio", return_value=2.0):
+            pixmap = icons.svg_pixmap(self.svg_path, 24, 24)
+        self.assertEqual((pixmap.width(), pixmap.height()), (48, 48))
+        self.assertEqual(pixmap.devicePixelRatio(), 2.0)
+        self.assertTrue(os.path.exists(os.path.join(self.tmpdir.name, "success_48x48.png")))
+
+    def test_missing_svg_returns_null_pixmap(self):
+        with patch.object(icons, "ICON_CACHE_DIR", self.tmpdir.name):
+            self.assertTrue(icons.svg_pixmap(os.path.join(self.tmpdir.name, "nope.svg"), 24, 24).isNull())
+
+    def test_scaled_pixmap_fits_and_is_shared(self):
+        source = QPixmap(48, 32)
+        source.fill(Qt.red)
+        source.save(os.path.join(self.tmpdir.name, "csv_icon.png"), "PNG")
+        with patch.object(icons, "ICON_DIR", self.tmpdir.name):
+            first = icons.scaled_pixmap("csv_icon.png", 24, 24)
+            self.assertFalse(first.isNull())
+            self.assertEqual((first.width(), first.height()), (24, 16))
+            self.assertEqual(first.cacheKey(), icons.scaled_pixmap("csv_icon.png", 24, 24).cacheKey())
+            self.assertTrue(icons.scaled_pixmap("missing.png", 24, 24).isNull())
+
+    def test_rendered_pixmaps_do_not_share_buffer(self):
+        success = icons._render_svg(self.svg_path, 24, 24)
+        before = success.toImage()
+        icons._render_svg(os.path.join(icons.ICON_DIR, "error.svg"), 24, 24)
+        self.assertEqual(success.toImage(), before)
+
+    def test_icon_dir_scanned_once(self):
+        self.assertTrue(icons.has_icon("spinner.svg"))
+        self.assertFalse(icons.has_icon("missing.svg"))
+        with patch("ui.icons.os.scandir") as mock_scandir:
+            self.assertTrue(icons.has_icon("success.svg"))
+            mock_scandir.assert_not_called()
+
+
+    def test_spinner_cycles_shared_frames_while_shown(self):
+        first, second = icons.SpinnerWidget(), icons.SpinnerWidget()
+        first.show()
+        second.show()
+        self.assertIs(first._frames, second._frames)
+        self.assertEqual(len(first._frames), icons._SPINNER_FRAMES)
+        self.assertNotEqual(first._frames[0].toImage(), first._frames[3].toImage())
+        self.assertTrue(first._timer.isActive())
+        first._next_frame()
+        self.assertEqual(first._frame, 1)
+        first.hide()
+        self.assertFalse(first._timer.isActive())
+        second.hide()
+
 class TestDropZone(unittest.TestCase):
     """Test the DropZone widget in import_file.py."""
 
@@ -259,6 +345,55 @@ class TestImportFilePage(unittest.TestCase):
         expected = f"FOLDER:{os.path.dirname(self.temp_file_path)}\n"
         self.assertIn(expected, contents)
 
+    def test_save_last_folder_replaces_previous_entry(self):
+        """Saving a folder rewrites its line once and keeps the other keys."""
+        tmp_dir = tempfile.mkdtemp()
+        settings_path = os.path.join(tmp_dir, "settings.txt")
+        with open(settings_path, "w", encoding="utf-8") as f:
+            f.write("TOKEN:test-token\nFOLDER:/old\n")
+
+        with patch("ui.pages.import_file.SETTINGS_FILE", settings_path):
+            page = ImportFilePage(self.mock_controller)
+            page.save_last_folder("/new")
+            self.assertEqual(page.load_last_folder(), "/new")
+
+        with open(settings_path, "r", encoding="utf-8") as f:
+            contents = f.read()
+
+        self.assertIn("TOKEN:test-token\n", contents)
+        self.assertEqual(contents.count("FOLDER:"), 1)
+
+    def test_unchanged_setting_is_not_rewritten(self):
+        """Saving the value already on disk skips the write."""
+        tmp_dir = tempfile.mkdtemp()
+        settings_path = os.path.join(tmp_dir, "settings.txt")
+        with open(settings_path, "w", encoding="utf-8") as f:
+            f.write("FOLDER:/same\nTOKEN:test-token\n")
+
+        with patch("ui.pages.import_file.SETTINGS_FILE", settings_path):
+            page = ImportFilePage(self.mock_controller)
+            with patch("ui.pages.import_file.write_private_file") as mock_write:
+                page.save_last_folder("/same")
+                page.handle_file_selected(os.path.join("/same", "statement.csv"))
+                mock_write.assert_not_called()
+                page.save_last_folder("/other")
+                mock_write.assert_called_once()
+
+    def test_settings_file_read_once_until_changed(self):
+        """Lookups reuse the parsed settings file until it is rewritten."""
+        tmp_dir = tempfile.mkdtemp()
+        settings_path = os.path.join(tmp_dir, "settings.txt")
+        with open(settings_path, "w", encoding="utf-8") as f:
+            f.write("FOLDER:/cached\nMODE:FILE\n")
+
+        with patch("ui.pages.import_file.SETTINGS_FILE", settings_path):
+            page = ImportFilePage(self.mock_controller)
+            with patch("builtins.open", side_effect=AssertionError("settings re-read")):
+                self.assertEqual(page.load_last_folder(), "/cached")
+                self.assertEqual(page.load_last_export_target(), "FILE")
+            page.save_last_folder("/changed")
+            self.assertEqual(page.load_last_folder(), "/changed")
+
     def test_mode_change_saves_selection(self):
         """Ensure selected export mode is persisted."""
         tmp_dir = tempfile.mkdtemp()
@@ -480,6 +615,20 @@ class TestAccountSelectionPage(unittest.TestCase):
         # Check that the controller was called to fetch accounts
         self.mock_controller.fetch_accounts.assert_called_with("budget1")
 
+    def test_needs_reinit_only_when_client_changes(self):
+        """Budgets are refetched only for a new client or after an error."""
+        self.page.initializePage()
+        self.mock_controller.fetch_budgets.assert_called_once()
+        self.assertFalse(self.page.needs_reinit)
+
+        self.mock_controller.ynab = MagicMock()
+        self.assertTrue(self.page.needs_reinit)
+
+        self.page.initializePage()
+        self.assertFalse(self.page.needs_reinit)
+        self.page.on_error("Unauthorized")
+        self.assertTrue(self.page.needs_reinit)
+
 
 class TestReviewAndUploadPage(unittest.TestCase):
     """Test the ReviewAndUploadPage widget."""
@@ -512,6 +661,20 @@ class TestReviewAndUploadPage(unittest.TestCase):
         self.page.hide_dup_checkbox.setChecked(False)
         self.assertFalse(self.page.table.isRowHidden(1))
 
+    def test_table_recovers_when_a_fill_fails(self):
+        """A record that cannot be rendered does not leave the table frozen."""
+        class Unprintable:
+            def __str__(self):
+                raise ValueError("bad value")
+
+        records = [{"Date": "2025-07-01", "Payee": Unprintable(), "Memo": "", "Amount": "1"}]
+        for fill in (lambda: self.page.on_duplicates_found(records, set()),
+                     lambda: self.page.populate_file_records(records)):
+            with self.assertRaises(ValueError):
+                fill()
+            self.assertTrue(self.page.table.updatesEnabled())
+            self.assertFalse(self.page.table.signalsBlocked())
+
     def test_duplicates_can_be_overridden(self):
         """Ensure users can include rows marked as duplicates by unskipping them."""
         self.page.records = [
@@ -538,6 +701,29 @@ class TestReviewAndUploadPage(unittest.TestCase):
         uploaded = self.page.controller.upload_transactions.call_args[0][2]
         self.assertEqual(len(uploaded), 2)
 
+    def test_error_message_survives_leaving_busy_state(self):
+        self.page.set_busy(True, "Checking for duplicates…")
+        self.page.on_error("Failed to check duplicates: timeout")
+        self.assertEqual(self.page.info_label.text(), "Error: Failed to check duplicates: timeout")
+        self.assertFalse(self.page._busy)
+
+    def test_upload_payload_formatting(self):
+        from ui.pages.review_upload import _upload_payload
+
+        payload = _upload_payload(
+            {"Date": "2025-12-12", "Payee": None, "Memo": "CUBE", "Amount": -2.6, "ImportId": " nan "},
+            "acc456",
+        )
+        self.assertEqual(payload, {
+            "account_id": "acc456",
+            "date": "2025-12-12",
+            "amount": -2600,
+            "payee_name": "",
+            "memo": "CUBE",
+        })
+        self.assertEqual(_upload_payload({"Amount": "1.5", "ImportId": "id-1"}, "a")["import_id"], "id-1")
+        self.assertIsNone(_upload_payload({"Amount": "n/a"}, "a"))
+
     @patch('ui.pages.review_upload.QMessageBox.information')
     def test_file_mode_requires_selected_rows(self, mock_info):
         self.page.controller.export_target = 'FILE'
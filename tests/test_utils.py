@@ -71,6 +71,21 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result.iloc[0]['Payee'], 'B')
 
+    def test_exclude_existing_parses_other_date_formats(self):
+        new_df = pd.DataFrame({
+            'Date': ['2025-02-25', '2025-02-26'],
+            'Payee': ['A', 'B'],
+            'Amount': [1, 2]
+        })
+        prev_df = pd.DataFrame({
+            'Date': ['02/25/2025', 'not a date'],
+            'Payee': ['A', 'B'],
+            'Amount': [1, 2]
+        })
+        result = utils.exclude_existing(new_df, prev_df)
+        self.assertEqual(list(result['Payee']), ['B'])
+        self.assertEqual(list(result['Date']), ['2025-02-26'])
+
     def test_exclude_existing_with_legacy_date_cutoff(self):
         new_df = pd.DataFrame({
             'Date': ['2025-02-24', '2025-02-25', '2025-02-26'],
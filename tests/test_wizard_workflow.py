@@ -1,6 +1,7 @@
 import unittest
 import sys
 import os
+import tempfile
 from unittest.mock import MagicMock, patch
 from PyQt5.QtWidgets import QApplication, QWizard, QWizardPage
 from PyQt5.QtCore import Qt, QEvent
@@ -54,8 +55,6 @@ if not app:
     app = QApplication(sys.argv)
 
 
-
-
 class TestStepLabel(unittest.TestCase):
     """Test the StepLabel class."""
     
@@ -66,28 +65,25 @@ class TestStepLabel(unittest.TestCase):
     def test_initialization(self):
         """Test that the label initializes correctly."""
         self.assertEqual(self.label.text(), "Test Step")
-        self.assertTrue(self.label.wordWrap())
+        self.assertFalse(self.label.wordWrap())
         self.assertEqual(self.label.alignment(), Qt.AlignLeft | Qt.AlignTop)
     
     def test_set_selected(self):
         """Test setting selected state."""
         # Initially not selected
         self.label.set_selected(False)
-        style = self.label.styleSheet()
-        self.assertIn("color:#333", style)
-        self.assertNotIn("background-color:#007AFF", style)
+        self.assertIs(self.label.property("selected"), False)
+        self.assertEqual(self.label.property("cssClass"), "step")
+        # Styling lives in the global QSS, not inline
+        self.assertEqual(self.label.styleSheet(), "")
         
         # Set to selected
         self.label.set_selected(True)
-        style = self.label.styleSheet()
-        self.assertIn("background-color:#0066cc", style)
-        self.assertIn("color:white", style)
+        self.assertIs(self.label.property("selected"), True)
         
         # Set back to not selected
         self.label.set_selected(False)
-        style = self.label.styleSheet()
-        self.assertIn("color:#333", style)
-        self.assertNotIn("background-color:#007AFF", style)
+        self.assertIs(self.label.property("selected"), False)
 
 
 class TestRobustWizard(unittest.TestCase):
@@ -156,9 +152,15 @@ class TestRobustWizard(unittest.TestCase):
     
     def test_next_id_override(self):
         """Test the overridden nextId method."""
-        # Skip this test as setCurrentPage is no longer available
-        # We would need to redesign this test for the new QStackedWidget approach
-        pass
+        for current, expected in ((0, 1), (3, 4), (4, 5), (5, -1)):
+            with patch.object(self.wizard, 'currentId', return_value=current):
+                self.assertEqual(self.wizard.nextId(), expected)
+
+        # Adding a page extends the table
+        extra_page = QWizardPage()
+        self.wizard.setPage(9, extra_page)
+        with patch.object(self.wizard, 'currentId', return_value=5):
+            self.assertEqual(self.wizard.nextId(), 9)
     
     def test_initialize_page(self):
         """Test page initialization."""
@@ -166,10 +168,14 @@ class TestRobustWizard(unittest.TestCase):
         self.wizard.initializePage(1)
     
     def test_close_event_with_workers(self):
-        """Test closeEvent handling of active workers."""
-        # Skip this test as MagicMock is not compatible with QCloseEvent
-        # We would need to create a proper QCloseEvent for this test
-        pass
+        """Closing leaves page attributes alone; worker threads belong to the controller."""
+        worker = MagicMock()
+        self.review_page.review_upload_worker = worker
+
+        self.wizard.close()
+
+        worker.isRunning.assert_not_called()
+        worker.quit.assert_not_called()
 
 
 class TestWizardWorkflowTransitions(unittest.TestCase):
@@ -279,11 +285,70 @@ class TestWizardWorkflowTransitions(unittest.TestCase):
             # Current page label should be selected, others not
             for j, label in enumerate(step_labels):
                 if j == i:
-                    # Check through style sheet that this label is selected
-                    self.assertIn("background-color:#0066cc", label.styleSheet())
+                    # Check through the QSS property that this label is selected
+                    self.assertTrue(label.property("selected"))
                 else:
-                    self.assertNotIn("background-color:#0066cc", label.styleSheet())
+                    self.assertFalse(label.property("selected"))
+
+    def test_sidebar_moves_highlight_between_steps(self):
+        """Only the previous and new step labels change when the step changes."""
+        step_labels = self.wizard_window.step_labels
+        # Switching target ticks the import page's mode radio, which saves the mode
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch('ui.pages.import_file.SETTINGS_FILE', os.path.join(tmpdir, 'settings.txt')):
+            self.wizard_window.set_steps_for_target('FILE')
+        self.wizard_window.update_sidebar(4)
+        selected = [bool(label.property("selected")) for label in step_labels]
+        self.assertEqual(selected, [False, True, False, False, False, False])
+
+        self.wizard_window.update_sidebar(5)
+        selected = [bool(label.property("selected")) for label in step_labels]
+        self.assertEqual(selected, [False, False, True, False, False, False])
+
+    def test_pages_built_on_first_navigation(self):
+        """Only the import page exists up front; others replace their placeholder on first visit."""
+        window = self.wizard_window
+        self.assertEqual(window.pages_stack.count(), 7)
+        self.assertIs(window.pages_stack.widget(0), window._pages[0])
+        self.assertEqual(window._pages[1:], [None] * 6)
+
+        window.import_page.file_path = "/path/to/test.xlsx"
+        self.mock_controller.export_target = 'YNAB'
+        window.go_to_page(1)
+        auth_page = window._pages[1]
+        self.assertIsInstance(auth_page, YNABAuthPage)
+        self.assertIs(window.pages_stack.widget(1), auth_page)
+        self.assertIs(window.pages_stack.currentWidget(), auth_page)
+        self.assertEqual(window.pages_stack.count(), 7)
+        self.assertIs(window.auth_page, auth_page)
+
+    def test_close_event_stops_controller_worker(self):
+        """Closing the window drains the controller's worker thread."""
+        self.wizard_window.close()
+        self.mock_controller.shutdown.assert_called_once_with()
+
+    def test_back_button_rewired_only_when_target_changes(self):
+        """Repeated nav updates keep a single back_button connection."""
+        window = self.wizard_window
+        window.update_nav_buttons()
+        window.update_nav_buttons()
+        self.assertEqual(window.back_button.text(), "Exit")
+        self.assertEqual(window.back_button.receivers(window.back_button.clicked), 1)
+        self.assertEqual(window._back_target, window.close)
 
+    def test_complete_changed_bursts_coalesce(self):
+        """Several completeChanged emits produce a single deferred nav update."""
+        window = self.wizard_window
+        page = window.pages_stack.widget(0)
+        fired = []
+        window._nav_update_timer.timeout.connect(lambda: fired.append(True))
+        page.completeChanged.emit()
+        page.completeChanged.emit()
+        page.completeChanged.emit()
+        self.assertEqual(fired, [])
+        self.assertTrue(window._nav_update_timer.isActive())
+        QTest.qWait(20)
+        self.assertEqual(fired, [True])
 
 if __name__ == '__main__':
     unittest.main()
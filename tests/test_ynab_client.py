@@ -11,7 +11,7 @@ class TestYnabClient(unittest.TestCase):
         self.mock_response = MagicMock()
         self.mock_response.status_code = 200
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_budgets(self, mock_get):
         """Test fetching budgets."""
         # Setup mock
@@ -33,7 +33,7 @@ class TestYnabClient(unittest.TestCase):
             timeout=10
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_accounts(self, mock_get):
         """Test fetching accounts for a budget."""
         # Setup mock
@@ -55,7 +55,7 @@ class TestYnabClient(unittest.TestCase):
             timeout=10
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_transactions(self, mock_get):
         """Test fetching transactions for an account."""
         # Setup mock
@@ -78,7 +78,7 @@ class TestYnabClient(unittest.TestCase):
             timeout=15
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_transactions_with_params(self, mock_get):
         """Test fetching transactions with pagination and filtering."""
         # Setup mock
@@ -99,7 +99,7 @@ class TestYnabClient(unittest.TestCase):
             timeout=15
         )
 
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_upload_transactions(self, mock_post):
         """Test uploading transactions."""
         # Setup mock
@@ -134,7 +134,7 @@ class TestYnabClient(unittest.TestCase):
             timeout=20
         )
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_get_account_name(self, mock_get):
         """Test getting account name with cache."""
         # Setup mock for the first call to get_accounts
@@ -163,7 +163,7 @@ class TestYnabClient(unittest.TestCase):
         name = self.client.get_account_name("budget1", "non_existent")
         self.assertEqual(name, "Unknown Account")
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_api_error_handling(self, mock_get):
         """Test handling of API errors."""
         # Setup mock to raise an exception
@@ -174,7 +174,7 @@ class TestYnabClient(unittest.TestCase):
         with self.assertRaises(requests.exceptions.HTTPError):
             self.client.get_budgets()
 
-    @patch('requests.get')
+    @patch('requests.Session.get')
     def test_connection_error_handling(self, mock_get):
         """Test handling of connection errors."""
         # Setup mock to raise a connection error
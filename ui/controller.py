@@ -1,5 +1,8 @@
 # ui/controller.py
+from concurrent.futures import ThreadPoolExecutor
+import math
 from typing import Optional
+import pandas as pd
 from PyQt5.QtCore import QObject, pyqtSignal, QThread
 from services.ynab_client import YnabClient
 from services.actual_client import ActualClient
@@ -92,20 +95,39 @@ class DuplicateCheckWorker(QObject):
 
     def run(self):
         try:
-            # Avoid writing any files during duplicate check; we only need the DataFrame.
-            df = self.converter.convert_to_ynab(self.file_path, write_output=False)
             # Fetch recent YNAB transactions for duplicate checking
             from datetime import datetime, timedelta
             since_date = (
                 datetime.now() - timedelta(days=DUP_CHECK_DAYS)
             ).strftime("%Y-%m-%d")
-            prev = self.ynab_client.get_transactions(
-                self.budget_id,
-                self.account_id,
-                count=DUP_CHECK_COUNT,
-                since_date=since_date,
-            )
+            # The fetch is network-bound and independent of the conversion, so
+            # it runs on a helper thread while the file is parsed here.
+            pool = ThreadPoolExecutor(max_workers=1)
+            try:
+                fetch = pool.submit(
+                    self.ynab_client.get_transactions,
+                    self.budget_id,
+                    self.account_id,
+                    count=DUP_CHECK_COUNT,
+                    since_date=since_date,
+                )
+                # Avoid writing any files during duplicate check; we only need the DataFrame.
+                df = self.converter.convert_to_ynab(self.file_path, write_output=False)
+                prev = fetch.result()
+            finally:
+                # Don't wait for an in-flight fetch if the conversion failed
+                pool.shutdown(wait=False)
             records = df.to_dict('records')
+            # Milliunit amounts for the whole column in one pass; NaN/inf (unparseable) -> None
+            amounts = (
+                pd.to_numeric(df['Amount'], errors='coerce')
+                if 'Amount' in df.columns
+                else pd.Series(0.0, index=df.index)
+            )
+            record_milliunits = [
+                int(v) if math.isfinite(v) else None
+                for v in (amounts.astype(float) * 1000).round()
+            ]
 
             def normalize_import_id(value):
                 if value is None:
@@ -173,17 +195,13 @@ class DuplicateCheckWorker(QObject):
                         if import_id in prev_import_ids:
                             dup_idx.add(i)
                             continue
-                date_csv = r.get("Date")
+                key = (r.get("Date"), record_milliunits[i])
+                if key not in all_memo:
+                    continue
+                # Text is only normalized for rows whose date and amount match
                 payee_csv = clean_text(r.get("Payee"))
                 memo_csv = clean_text(r.get("Memo"))
-                try:
-                    amt_csv = int(round(float(r.get("Amount", 0)) * 1000))
-                except Exception:
-                    amt_csv = None
                 is_transfer_csv = payee_csv.startswith("transfer :")
-                key = (date_csv, amt_csv)
-                if key not in all_memo:
-                    continue
                 memo_csv_prefix = memo_prefix(memo_csv)
                 if is_transfer_csv:
                     if memo_csv_prefix in all_memo.get(key, set()):
@@ -290,6 +308,10 @@ class WizardController(QObject):
             self.worker = None
             self.worker_thread = None
 
+    def shutdown(self):
+        """Stop the running worker thread, if any (called when the wizard closes)."""
+        self._cleanup_thread()
+
     def authorize(self, token: str, save: bool):
         """Store token and optionally persist it via UI settings."""
         try:
@@ -297,6 +319,9 @@ class WizardController(QObject):
                 self.errorOccurred.emit("Token cannot be empty")
                 return False
 
+            if isinstance(self.ynab, YnabClient) and self.ynab.token == token:
+                # Same token (e.g. Back then Continue): keep the client and its open connection
+                return True
             self.ynab = YnabClient(token)
             logger.info("[WizardController] YNAB client initialized with token")
             return True
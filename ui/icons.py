@@ -0,0 +1,206 @@
+# ui/icons.py
+import functools
+import os
+import re
+from PyQt5.QtCore import QByteArray, QRectF, Qt, QTimer
+from PyQt5.QtGui import QGuiApplication, QImage, QPainter, QPixmap, QPixmapCache
+from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtWidgets import QWidget
+from config import CACHE_DIR, get_logger
+
+logger = get_logger(__name__)
+
+ICON_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'resources', 'icons'))
+ICON_CACHE_DIR = str(CACHE_DIR / "icons")
+
+
+@functools.lru_cache(maxsize=None)
+def _dir_index(directory: str) -> dict:
+    """Map file name -> mtime for every file in directory, from one os.scandir pass.
+
+    Taken once per process; icons do not change while the app runs, and a stale
+    entry for the PNG cache only costs a re-render.
+    """
+    index = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    index[entry.name] = entry.stat().st_mtime
+    except OSError as e:
+        logger.debug("[Icons] Could not scan %s: %s", directory, e)
+    return index
+
+
+def _mtime(path: str):
+    """mtime of path via the directory index, or None if it does not exist."""
+    directory, name = os.path.split(path)
+    return _dir_index(directory).get(name)
+
+
+def has_icon(name: str) -> bool:
+    """True if resources/icons contains name."""
+    return name in _dir_index(ICON_DIR)
+
+
+def icon_path(name: str) -> str:
+    """Absolute path of a file in resources/icons."""
+    return os.path.join(ICON_DIR, name)
+
+
+def scaled_pixmap(name: str, width: int, height: int) -> QPixmap:
+    """Return the raster icon resources/icons/<name> scaled to fit width x height.
+
+    Kept in Qt's process-wide QPixmapCache; returns a null QPixmap if the file
+    is missing.
+    """
+    key = f"icon:{name}@{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(icon_path(name))
+        if pixmap.isNull():
+            return pixmap
+        pixmap = pixmap.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _cache_path(svg_path: str, width: int, height: int) -> str:
+    name = os.path.splitext(os.path.basename(svg_path))[0]
+    return os.path.join(ICON_CACHE_DIR, f"{name}_{width}x{height}.png")
+
+
+@functools.lru_cache(maxsize=None)
+def _render_buffer(width: int, height: int) -> QImage:
+    """Raster image reused by every SVG rendered at this size."""
+    return QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+
+
+def _render_svg(svg_path: str, width: int, height: int) -> QPixmap:
+    image = _render_buffer(width, height)
+    image.fill(0)
+    painter = QPainter(image)
+    QSvgRenderer(svg_path).render(painter)
+    painter.end()
+    # fromImage copies the pixels, so the buffer can be reused for the next icon
+    return QPixmap.fromImage(image)
+
+
+def _device_pixel_ratio() -> float:
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app is not None else 1.0
+
+
+def svg_pixmap(svg_path: str, width: int, height: int) -> QPixmap:
+    """Return svg_path rasterized for a width x height (logical pixels) label.
+
+    The SVG is rendered at the device pixel ratio so HiDPI screens paint it
+    without scaling. Pixmaps are kept in Qt's process-wide QPixmapCache. On
+    disk the PNG is cached under the app cache dir and reused while it is newer
+    than the SVG, so SVG parsing/painting only happens on the first run or after
+    the icon changes. Returns a null QPixmap if the SVG is missing.
+    """
+    dpr = _device_pixel_ratio()
+    pixel_width, pixel_height = round(width * dpr), round(height * dpr)
+    key = f"svg:{svg_path}@{pixel_width}x{pixel_height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = _load_pixmap(svg_path, pixel_width, pixel_height)
+        if not pixmap.isNull():
+            pixmap.setDevicePixelRatio(dpr)
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def _load_pixmap(svg_path: str, width: int, height: int) -> QPixmap:
+    svg_mtime = _mtime(svg_path)
+    if svg_mtime is None:
+        return QPixmap()
+    cache_path = _cache_path(svg_path, width, height)
+    cache_mtime = _mtime(cache_path)
+    if cache_mtime is not None and cache_mtime >= svg_mtime:
+        pixmap = QPixmap(cache_path)
+        if not pixmap.isNull():
+            return pixmap
+    pixmap = _render_svg(svg_path, width, height)
+    try:
+        os.makedirs(ICON_CACHE_DIR, exist_ok=True)
+        if pixmap.save(cache_path, "PNG"):
+            _dir_index(ICON_CACHE_DIR)[os.path.basename(cache_path)] = os.path.getmtime(cache_path)
+        else:
+            logger.debug("[Icons] Could not write %s", cache_path)
+    except OSError as e:
+        logger.debug("[Icons] Could not create %s: %s", ICON_CACHE_DIR, e)
+    return pixmap
+
+
+# spinner.svg turns once every 0.8 s; it is pre-rendered at this many angles
+_SPINNER_FRAMES = 12
+_SPINNER_PERIOD_MS = 800
+
+
+@functools.lru_cache(maxsize=None)
+def _spinner_frames(size: int, dpr: float) -> tuple:
+    """spinner.svg rendered once per rotation step for a size x size (logical) widget."""
+    try:
+        with open(icon_path('spinner.svg'), 'rb') as f:
+            svg = f.read()
+    except OSError as e:
+        logger.debug("[Icons] Could not read spinner.svg: %s", e)
+        return ()
+    # Drop the SVG's own rotation; the painter supplies the angle of each frame
+    renderer = QSvgRenderer(QByteArray(re.sub(rb"<animateTransform\b[^>]*/>", b"", svg)))
+    pixels = round(size * dpr)
+    image = _render_buffer(pixels, pixels)
+    frames = []
+    for step in range(_SPINNER_FRAMES):
+        image.fill(0)
+        painter = QPainter(image)
+        painter.translate(pixels / 2, pixels / 2)
+        painter.rotate(step * 360 / _SPINNER_FRAMES)
+        painter.translate(-pixels / 2, -pixels / 2)
+        renderer.render(painter, QRectF(0, 0, pixels, pixels))
+        painter.end()
+        frame = QPixmap.fromImage(image)
+        frame.setDevicePixelRatio(dpr)
+        frames.append(frame)
+    return tuple(frames)
+
+
+class SpinnerWidget(QWidget):
+    """Animated spinner cycling through pre-rendered frames shared by all spinners.
+
+    Frames are rendered on first show; the frame timer only runs while shown.
+    """
+
+    def __init__(self, size: int = 36, parent=None):
+        super().__init__(parent)
+        self.setFixedSize(size, size)
+        self._frames = ()
+        self._frame = 0
+        self._timer = QTimer(self)
+        self._timer.setInterval(_SPINNER_PERIOD_MS // _SPINNER_FRAMES)
+        self._timer.timeout.connect(self._next_frame)
+
+    def showEvent(self, event):
+        if not self._frames:
+            self._frames = _spinner_frames(self.width(), _device_pixel_ratio())
+        self._frame = 0
+        self._timer.start()
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self._timer.stop()
+        super().hideEvent(event)
+
+    def _next_frame(self):
+        if not self._frames:
+            return
+        self._frame = (self._frame + 1) % len(self._frames)
+        self.update()
+
+    def paintEvent(self, event):
+        if self._frames:
+            painter = QPainter(self)
+            painter.drawPixmap(0, 0, self._frames[self._frame])
+            painter.end()
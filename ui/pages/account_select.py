@@ -22,6 +22,8 @@ class AccountSelectionPage(QWidget):
         self.transactions = []
         self._budget_manual_connected = False
         self._account_manual_connected = False
+        # Client the current budget list was requested from
+        self._budgets_client = None
 
         # --- Outer layout ---
         outer_layout = QVBoxLayout(self)
@@ -135,6 +137,11 @@ class AccountSelectionPage(QWidget):
         # Give the combo boxes focus to make them more noticeable
         self.budget_combo.setFocus()
 
+    @property
+    def needs_reinit(self):
+        """Budgets only need refetching when the API client has changed."""
+        return self.controller.ynab is not self._budgets_client
+
     def initializePage(self):
         self.logger.info("[AccountSelectionPage] initializePage called; target=%s client=%s",
                          getattr(self.controller, 'export_target', None),
@@ -146,6 +153,7 @@ class AccountSelectionPage(QWidget):
             self.logger.info("[AccountSelectionPage] Fetching budgets from client=%s",
                              type(self.controller.ynab).__name__)
             self.controller.fetch_budgets()
+            self._budgets_client = self.controller.ynab
         except Exception as e:
             self.logger.error("[AccountSelectionPage] Error fetching budgets: %s", e)
 
@@ -283,8 +291,8 @@ class AccountSelectionPage(QWidget):
         self.update_helper()
         self.validate_fields()
 
-        # Force UI update
-        self.budget_combo.repaint()
+        # Schedule a repaint with the next paint pass
+        self.budget_combo.update()
 
     def on_account_changed(self, idx):
         self.logger.info("[AccountSelectionPage] Account index changed: %s", idx)
@@ -319,6 +327,8 @@ class AccountSelectionPage(QWidget):
         self.account_combo.blockSignals(False)
         self.selected_budget_id = None
         self.selected_account_id = None
+        # Retry the fetch on the next visit
+        self._budgets_client = None
         self.validate_fields()
 
     def update_helper(self):
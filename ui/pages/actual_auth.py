@@ -5,7 +5,7 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from urllib.parse import urlparse
 import os
-from config import SETTINGS_FILE, ACTUAL_SETTINGS_FILE, get_logger, ensure_app_dir
+from config import SETTINGS_FILE, ACTUAL_SETTINGS_FILE, get_logger, ensure_app_dir, write_private_file
 from services import token_manager as _token_manager
 
 
@@ -157,17 +157,16 @@ class ActualAuthPage(QWizardPage):
         ensure_app_dir()
         enc_server_pwd = _token_manager.encrypt_token(pwd).decode()
         enc_budget_pwd = _token_manager.encrypt_token(budget_pwd).decode() if budget_pwd else ""
-        with open(ACTUAL_SETTINGS_FILE, 'w') as f:
-            f.write(f"ACTUAL_URL:{url}\n")
-            f.write(f"ACTUAL_PWD:{enc_server_pwd}\n")
-            if enc_budget_pwd:
-                f.write(f"ACTUAL_E2E_PWD:{enc_budget_pwd}\n")
-        try:
-            os.chmod(ACTUAL_SETTINGS_FILE, 0o600)
-        except OSError:
-            pass
+        write_private_file(ACTUAL_SETTINGS_FILE, self._actual_settings_text(url, enc_server_pwd, enc_budget_pwd))
         self._remove_legacy_actual_lines()
 
+    @staticmethod
+    def _actual_settings_text(url: str, enc_pwd: str, enc_e2e_pwd: str) -> str:
+        text = f"ACTUAL_URL:{url}\nACTUAL_PWD:{enc_pwd}\n"
+        if enc_e2e_pwd:
+            text += f"ACTUAL_E2E_PWD:{enc_e2e_pwd}\n"
+        return text
+
     def _remove_legacy_actual_lines(self) -> None:
         if not os.path.exists(SETTINGS_FILE):
             return
@@ -177,12 +176,7 @@ class ActualAuthPage(QWizardPage):
                     ln for ln in f
                     if not ln.startswith(("ACTUAL_URL:", "ACTUAL_PWD:", "ACTUAL_E2E_PWD:"))
                 ]
-            with open(SETTINGS_FILE, 'w') as f:
-                f.writelines(lines)
-            try:
-                os.chmod(SETTINGS_FILE, 0o600)
-            except OSError:
-                pass
+            write_private_file(SETTINGS_FILE, "".join(lines))
         except OSError as exc:
             self.logger.warning("[ActualAuthPage] Failed to cleanup legacy settings lines: %s", exc)
 
@@ -239,15 +233,10 @@ class ActualAuthPage(QWizardPage):
                         pass
                 if legacy_url and legacy_pwd:
                     try:
-                        with open(ACTUAL_SETTINGS_FILE, 'w') as f:
-                            f.write(f"ACTUAL_URL:{legacy_url}\n")
-                            f.write(f"ACTUAL_PWD:{legacy_pwd}\n")
-                            if legacy_e2e:
-                                f.write(f"ACTUAL_E2E_PWD:{legacy_e2e}\n")
-                        try:
-                            os.chmod(ACTUAL_SETTINGS_FILE, 0o600)
-                        except OSError:
-                            pass
+                        write_private_file(
+                            ACTUAL_SETTINGS_FILE,
+                            self._actual_settings_text(legacy_url, legacy_pwd, legacy_e2e),
+                        )
                     except Exception:
                         pass
             except Exception:
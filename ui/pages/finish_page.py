@@ -9,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 
 class FinishPage(QWizardPage):
+    # Summary text depends on the upload/export that just finished
+    needs_reinit = True
+
     def __init__(self, controller=None, parent=None):
         super().__init__(parent)
         self.controller = controller
@@ -14,14 +14,18 @@ from PyQt5.QtWidgets import (
     QButtonGroup,
 )
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QCursor, QPixmap
-from PyQt5.QtSvg import QSvgWidget
+from PyQt5.QtGui import QCursor
 import os
 
-from config import SETTINGS_FILE, get_logger
+from config import SETTINGS_FILE, get_logger, write_private_file
+from ui.icons import has_icon, icon_path, scaled_pixmap, svg_pixmap
 
 logger = get_logger(__name__)
 
+# ((path, inode, mtime_ns, size), lines) of the settings file as last read; any
+# write (ours, the token manager's or an atomic replace) changes the key.
+_settings_cache = None
+
 
 class DropZone(QFrame):
     fileClicked = pyqtSignal()
@@ -39,12 +43,10 @@ class DropZone(QFrame):
         layout.setSpacing(8)
         layout.setContentsMargins(16, 16, 16, 16)  # Original padding restored for drop zone functionality
         # Upload icon
-        icon_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), '../../resources/icons/cloud_download.svg')
-        )
-        if os.path.exists(icon_path):
-            self.upload_icon = QSvgWidget(icon_path)
+        if has_icon('cloud_download.svg'):
+            self.upload_icon = QLabel()
             self.upload_icon.setFixedSize(48, 48)
+            self.upload_icon.setPixmap(svg_pixmap(icon_path('cloud_download.svg'), 48, 48))
             layout.addWidget(self.upload_icon, alignment=Qt.AlignHCenter)
         # Default text
         self.text_label = QLabel("Drag & drop your file here,\nor click 'Browse files…'")
@@ -107,6 +109,8 @@ class DropZone(QFrame):
 
 class ImportFilePage(QWizardPage):
     MODE_SETTING_PREFIX = "MODE:"
+    # Re-sync mode radios with the controller on every visit
+    needs_reinit = True
 
     def __init__(self, controller):
         super().__init__()
@@ -336,13 +340,23 @@ class ImportFilePage(QWizardPage):
             self._write_setting_value(self.MODE_SETTING_PREFIX, target_norm)
 
     def _read_settings_lines(self):
-        if not os.path.exists(SETTINGS_FILE):
-            return []
+        global _settings_cache
+        try:
+            st = os.stat(SETTINGS_FILE)
+        except OSError:
+            return ()
+        key = (SETTINGS_FILE, st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _settings_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         try:
             with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-                return f.readlines()
+                lines = tuple(f.readlines())
         except Exception:
-            return []
+            # Unreadable or legacy binary settings file
+            return ()
+        _settings_cache = (key, lines)
+        return lines
 
     def _read_setting_value(self, prefix: str):
         for line in self._read_settings_lines():
@@ -351,14 +365,14 @@ class ImportFilePage(QWizardPage):
         return ""
 
     def _write_setting_value(self, prefix: str, value: str):
-        lines = [line for line in self._read_settings_lines() if not line.startswith(prefix)]
+        old_lines = self._read_settings_lines()
+        lines = [line for line in old_lines if not line.startswith(prefix)]
         lines.append(f"{prefix}{value}\n")
-        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-            f.writelines(lines)
-        try:
-            os.chmod(SETTINGS_FILE, 0o600)
-        except OSError:
-            pass
+        if sorted(lines) == sorted(old_lines):
+            # Value already stored; nothing to write
+            return
+        # One read above, one write here; other keys (TOKEN:, MODE:) are kept
+        write_private_file(SETTINGS_FILE, "".join(lines))
 
     def _set_mode_radio(self, target: str):
         target_norm = (target or "").upper()
@@ -376,18 +390,15 @@ class ImportFilePage(QWizardPage):
         self.file_path = file_path
         # Persist directory for next launch
         folder = os.path.dirname(file_path)
-        if folder:
+        if folder and folder != self.last_folder:
             self.last_folder = folder
             self.save_last_folder(folder)
         _, ext = os.path.splitext(file_path)
         # Set file icon
-        if ext.lower() == ".csv":
-            icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../resources/icons/csv_icon.png'))
-        else:
-            icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../resources/icons/excel_icon.png'))
-        if os.path.exists(icon_path):
-            self.file_icon_label.setPixmap(QPixmap(icon_path).scaled(
-                24, 24, Qt.KeepAspectRatio, Qt.SmoothTransformation))
+        icon_name = "csv_icon.png" if ext.lower() == ".csv" else "excel_icon.png"
+        file_icon = scaled_pixmap(icon_name, 24, 24)
+        if not file_icon.isNull():
+            self.file_icon_label.setPixmap(file_icon)
         else:
             self.file_icon_label.clear()
         # Validation: check if file can be opened and has at least 1 data row
@@ -14,15 +14,41 @@ from PyQt5.QtWidgets import (
     QAbstractItemView,
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtSvg import QSvgWidget
 import os
+from ui.icons import SpinnerWidget, icon_path, svg_pixmap
 from services.conversion_service import generate_output_filename, sanitize_csv_formulas
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _upload_payload(tx: dict, account_id: str):
+    """YNAB transaction body for a reviewed record, or None if its amount is invalid."""
+    try:
+        amount_milliunits = int(round(float(tx.get("Amount", 0)) * 1000))
+    except (ValueError, TypeError):
+        return None
+    payload = {
+        "account_id": account_id,
+        "date": str(tx.get("Date", "")),
+        "amount": amount_milliunits,
+        "payee_name": str(tx.get("Payee", "") or ""),
+        "memo": str(tx.get("Memo", "") or ""),
+    }
+    import_id = tx.get("ImportId") or tx.get("Import ID") or tx.get("import_id")
+    if isinstance(import_id, str):
+        import_id = import_id.strip()
+        if import_id.lower() in ("", "nan", "none"):
+            import_id = None
+    if import_id:
+        payload["import_id"] = import_id
+    return payload
+
+
 class ReviewAndUploadPage(QWizardPage):
+    # Rerun conversion/duplicate check for the current file and account
+    needs_reinit = True
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -44,31 +70,10 @@ class ReviewAndUploadPage(QWizardPage):
         card_layout.addWidget(self.label)
 
         # Load icons: success, error, info, spinner
-        base = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../resources/icons'))
-        # Success icon
-        success_path = os.path.join(base, 'success.svg')
-        try:
-            self.success_icon = QSvgWidget(success_path)
-            self.success_icon.setFixedSize(24, 24)
-        except Exception:
-            self.success_icon = QLabel()
-        self.success_icon.hide()
-        # Error icon
-        error_path = os.path.join(base, 'error.svg')
-        try:
-            self.error_icon = QSvgWidget(error_path)
-            self.error_icon.setFixedSize(24, 24)
-        except Exception:
-            self.error_icon = QLabel()
-        self.error_icon.hide()
-        # Info icon
-        info_path = os.path.join(base, 'info.svg')
-        try:
-            self.info_icon = QSvgWidget(info_path)
-            self.info_icon.setFixedSize(24, 24)
-        except Exception:
-            self.info_icon = QLabel()
-        self.info_icon.hide()
+        # Static status icons are pre-rendered pixmaps (cached as PNG)
+        self.success_icon = self._status_icon(icon_path('success.svg'))
+        self.error_icon = self._status_icon(icon_path('error.svg'))
+        self.info_icon = self._status_icon(icon_path('info.svg'))
         # Info label
         self.info_label = QLabel("")
         self.info_label.setObjectName("info-label")
@@ -86,12 +91,7 @@ class ReviewAndUploadPage(QWizardPage):
         self.counts_label.setWordWrap(True)
         card_layout.addWidget(self.counts_label)
         # Spinner icon
-        spinner_path = os.path.join(base, 'spinner.svg')
-        try:
-            self.spinner = QSvgWidget(spinner_path)
-            self.spinner.setFixedSize(36, 36)
-        except Exception:
-            self.spinner = QLabel()
+        self.spinner = SpinnerWidget(36)
         self.spinner.hide()
         card_layout.addWidget(self.spinner, alignment=Qt.AlignCenter)
 
@@ -143,6 +143,14 @@ class ReviewAndUploadPage(QWizardPage):
         self.worker = None
         self.set_bulk_buttons_enabled(False)
 
+    @staticmethod
+    def _status_icon(svg_path):
+        icon = QLabel()
+        icon.setFixedSize(24, 24)
+        icon.setPixmap(svg_pixmap(svg_path, 24, 24))
+        icon.hide()
+        return icon
+
     def _reset_status_ui(self):
         self.success_icon.hide()
         self.error_icon.hide()
@@ -245,29 +253,33 @@ class ReviewAndUploadPage(QWizardPage):
         self.table.setHorizontalHeaderLabels(headers)
         skip_col = col_count - 1 if col_count else None
         self.skip_column_index = skip_col
-        # Block signals while initializing
+        # Block signals and repaints while initializing; one repaint at the end
         self.table.blockSignals(True)
-        for row, rec in enumerate(records):
-            # Data columns
-            for col, key in enumerate(rec):
-                item = QTableWidgetItem(str(rec[key]))
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row, rec in enumerate(records):
+                # Data columns
+                for col, key in enumerate(rec):
+                    item = QTableWidgetItem(str(rec[key]))
+                    if row in dup_idx:
+                        item.setBackground(Qt.yellow)
+                    self.table.setItem(row, col, item)
+                # Status column
+                status_item = QTableWidgetItem("Duplicate" if row in dup_idx else "Ready")
+                status_item.setFlags(Qt.ItemIsEnabled)
+                self.table.setItem(row, col_count - 2, status_item)
+                # Skip column as checkable item
+                skip_item = QTableWidgetItem()
+                skip_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                skip_item.setCheckState(Qt.Checked if row in dup_idx else Qt.Unchecked)
                 if row in dup_idx:
-                    item.setBackground(Qt.yellow)
-                self.table.setItem(row, col, item)
-            # Status column
-            status_item = QTableWidgetItem("Duplicate" if row in dup_idx else "Ready")
-            status_item.setFlags(Qt.ItemIsEnabled)
-            self.table.setItem(row, col_count - 2, status_item)
-            # Skip column as checkable item
-            skip_item = QTableWidgetItem()
-            skip_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            skip_item.setCheckState(Qt.Checked if row in dup_idx else Qt.Unchecked)
-            if row in dup_idx:
-                self.skipped_rows.add(row)
-            self.table.setItem(row, skip_col, skip_item)
-        self.set_busy(False, "")
-        self._reset_status_ui()
-        self.table.blockSignals(False)
+                    self.skipped_rows.add(row)
+                self.table.setItem(row, skip_col, skip_item)
+            self.set_busy(False, "")
+            self._reset_status_ui()
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
         # Resize columns and rows to show checkboxes
         header = self.table.horizontalHeader()
         for c in range(col_count - 1):
@@ -335,30 +347,10 @@ class ReviewAndUploadPage(QWizardPage):
             return
         if budget_id and account_id and to_upload:
             try:
-                formatted = []
-                for tx in to_upload:
-                    try:
-                        amount_milliunits = int(round(float(tx.get("Amount", 0)) * 1000))
-                    except (ValueError, TypeError):
-                        continue
-                    import_id = (
-                        tx.get("ImportId")
-                        or tx.get("Import ID")
-                        or tx.get("import_id")
-                    )
-                    if isinstance(import_id, str):
-                        import_id = import_id.strip()
-                        if import_id.lower() in ("", "nan", "none"):
-                            import_id = None
-                    formatted.append({
-                        "account_id": account_id,
-                        "date": str(tx.get("Date", "")),
-                        "amount": amount_milliunits,
-                        "payee_name": str(tx.get("Payee", "") or ""),
-                        "memo": str(tx.get("Memo", "") or "")
-                    })
-                    if import_id:
-                        formatted[-1]["import_id"] = import_id
+                formatted = [
+                    payload for payload in (_upload_payload(tx, account_id) for tx in to_upload)
+                    if payload is not None
+                ]
                 logger.info("[ReviewUploadPage] formatted transactions: %d", len(formatted))
                 if formatted:
                     logger.info("[ReviewUploadPage] Calling controller.upload_transactions")
@@ -512,11 +504,13 @@ class ReviewAndUploadPage(QWizardPage):
                 parent.go_to_page(current_index + 1)
 
     def on_error(self, msg):
+        # Leave busy state first: set_busy(False) clears the label, which would
+        # otherwise wipe the message and cost a second relayout.
+        self.set_busy(False, "")
         self.success_icon.hide()
         self.error_icon.show()
         self.info_icon.hide()
         self.info_label.setText(f"Error: {msg}")
-        self.set_busy(False, "")
 
     def show_success(self, msg):
         self.set_busy(False, "")
@@ -558,31 +552,35 @@ class ReviewAndUploadPage(QWizardPage):
         self.skip_column_index = 0
         self.skip_checked_value = False  # Checked means include
         self.table.blockSignals(True)
-        headers = ["Import", "Date", "Payee", "Amount", "Memo"]
-        self.table.clearContents()
-        self.table.setRowCount(len(records))
-        self.table.setColumnCount(len(headers))
-        self.table.setHorizontalHeaderLabels(headers)
-        for row, rec in enumerate(records):
-            include_item = QTableWidgetItem()
-            include_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-            include_item.setCheckState(Qt.Checked)
-            self.table.setItem(row, 0, include_item)
-            date_item = QTableWidgetItem(str(rec.get("Date", "")))
-            self.table.setItem(row, 1, date_item)
-            payee_item = QTableWidgetItem(str(rec.get("Payee", "") or ""))
-            self.table.setItem(row, 2, payee_item)
-            raw_amount = rec.get("Amount", "")
-            try:
-                amount_val = float(raw_amount)
-                amount_item = QTableWidgetItem(f"{amount_val:.2f}")
-                amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            except (TypeError, ValueError):
-                amount_item = QTableWidgetItem(str(raw_amount))
-            self.table.setItem(row, 3, amount_item)
-            memo_item = QTableWidgetItem(str(rec.get("Memo", "") or ""))
-            self.table.setItem(row, 4, memo_item)
-        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            headers = ["Import", "Date", "Payee", "Amount", "Memo"]
+            self.table.clearContents()
+            self.table.setRowCount(len(records))
+            self.table.setColumnCount(len(headers))
+            self.table.setHorizontalHeaderLabels(headers)
+            for row, rec in enumerate(records):
+                include_item = QTableWidgetItem()
+                include_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                include_item.setCheckState(Qt.Checked)
+                self.table.setItem(row, 0, include_item)
+                date_item = QTableWidgetItem(str(rec.get("Date", "")))
+                self.table.setItem(row, 1, date_item)
+                payee_item = QTableWidgetItem(str(rec.get("Payee", "") or ""))
+                self.table.setItem(row, 2, payee_item)
+                raw_amount = rec.get("Amount", "")
+                try:
+                    amount_val = float(raw_amount)
+                    amount_item = QTableWidgetItem(f"{amount_val:.2f}")
+                    amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                except (TypeError, ValueError):
+                    amount_item = QTableWidgetItem(str(raw_amount))
+                self.table.setItem(row, 3, amount_item)
+                memo_item = QTableWidgetItem(str(rec.get("Memo", "") or ""))
+                self.table.setItem(row, 4, memo_item)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
 
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
@@ -616,11 +614,15 @@ class ReviewAndUploadPage(QWizardPage):
 
         row_count = self.table.rowCount()
         self.table.blockSignals(True)
-        for row in range(row_count):
-            item = self.table.item(row, self.skip_column_index)
-            if item is not None:
-                item.setCheckState(target_state)
-        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(False)
+        try:
+            for row in range(row_count):
+                item = self.table.item(row, self.skip_column_index)
+                if item is not None:
+                    item.setCheckState(target_state)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self.table.blockSignals(False)
 
         self.skipped_rows = set() if include else set(range(row_count))
         self.update_counts_label()
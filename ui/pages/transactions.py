@@ -13,15 +13,17 @@ from PyQt5.QtWidgets import (
     QMessageBox,
 )
 from PyQt5.QtCore import Qt
-from PyQt5.QtSvg import QSvgWidget
 
-import os
 import logging
+from ui.icons import SpinnerWidget, icon_path, svg_pixmap
 
 logger = logging.getLogger(__name__)
 
 
 class TransactionsPage(QWizardPage):
+    # Refetch for whichever account is currently selected
+    needs_reinit = True
+
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
@@ -40,15 +42,11 @@ class TransactionsPage(QWizardPage):
         self.label.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(self.label)
 
-        icon_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../resources/icons/error.svg'))
-        # Setup error icon without crashing on SVG
-        try:
-            self.error_icon = QSvgWidget(icon_path)
-            self.error_icon.setFixedSize(24, 24)
-            self.error_icon.hide()
-        except Exception:
-            self.error_icon = QLabel()
-            self.error_icon.hide()
+        # Static error icon as a pre-rendered pixmap (cached as PNG)
+        self.error_icon = QLabel()
+        self.error_icon.setFixedSize(24, 24)
+        self.error_icon.setPixmap(svg_pixmap(icon_path('error.svg'), 24, 24))
+        self.error_icon.hide()
         self.error_label = QLabel("")
         self.error_label.setObjectName("error-label")
         self.error_label.setWordWrap(True)
@@ -58,15 +56,8 @@ class TransactionsPage(QWizardPage):
         icon_label_layout.addStretch()
         card_layout.addLayout(icon_label_layout)
 
-        spinner_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../resources/icons/spinner.svg'))
-        # Setup spinner without crashing on SVG
-        try:
-            self.spinner = QSvgWidget(spinner_path)
-            self.spinner.setFixedSize(36, 36)
-            self.spinner.hide()
-        except Exception:
-            self.spinner = QLabel()
-            self.spinner.hide()
+        self.spinner = SpinnerWidget(36)
+        self.spinner.hide()
         card_layout.addWidget(self.spinner, alignment=Qt.AlignCenter)
 
         self.cache_label = QLabel("")
@@ -171,6 +162,8 @@ class TransactionsPage(QWizardPage):
                 'memo': 'Memo'
             }
 
+            # No repaints while the cells are filled; one repaint at the end
+            self.table.setUpdatesEnabled(False)
             self.table.setRowCount(len(txns))
             self.table.setColumnCount(len(columns_to_show))
             self.table.setHorizontalHeaderLabels(columns_to_show.values())
@@ -197,6 +190,7 @@ class TransactionsPage(QWizardPage):
                         item = QTableWidgetItem(str(raw_value) if raw_value is not None else "")
 
                     self.table.setItem(row, col, item)
+            self.table.setUpdatesEnabled(True)
 
             # Adjust column widths
             header = self.table.horizontalHeader()
@@ -208,6 +202,7 @@ class TransactionsPage(QWizardPage):
             self.error_icon.hide()
             self.error_label.setText("")
         except Exception as e:
+            self.table.setUpdatesEnabled(True)
             self.spinner.hide()
             self.error_icon.show()
             msg = str(e)
@@ -1,6 +1,9 @@
 import sys
 import os
-import traceback
+import functools
+import importlib
+import re
+from concurrent.futures import ThreadPoolExecutor
 import shutil
 from PyQt5.QtWidgets import (
     QApplication,
@@ -17,44 +20,154 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QMessageBox,
 )
-from PyQt5.QtGui import QIcon, QPixmap, QPainter, QFont, QPalette, QColor
-from PyQt5.QtCore import Qt
-from PyQt5.QtSvg import QSvgRenderer
+from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
+from PyQt5.QtCore import Qt, QTimer, QFile
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
 
-# Fix relative imports when running directly
+# Fix absolute imports when running directly
 if __name__ == "__main__":
     # Add parent directory to path so imports work
     sys.path.insert(0, os.path.dirname(os.path.dirname(
         os.path.abspath(__file__))))
-    from ui.controller import WizardController
-    from ui.pages.import_file import ImportFilePage
-    from ui.pages.auth import YNABAuthPage
-    from ui.pages.actual_auth import ActualAuthPage
-    from ui.pages.account_select import AccountSelectionPage  # Using standard implementation
-    from ui.pages.transactions import (TransactionsPage)
 
-    from ui.pages.review_upload import (ReviewAndUploadPage)
+from ui.controller import WizardController
+from config import CACHE_DIR
 
-    from ui.pages.finish_page import FinishPage
-else:
-    # Normal relative imports when imported as a module
-    from .controller import WizardController
-    from .pages.import_file import ImportFilePage
-    from .pages.auth import YNABAuthPage
-    from .pages.actual_auth import ActualAuthPage
-    from .pages.account_select import AccountSelectionPage  # Using standard implementation
-    from .pages.transactions import (TransactionsPage)
+logger = logging.getLogger(__name__)
 
-    from .pages.review_upload import (ReviewAndUploadPage)
+# Optional compiled resources (pyrcc5 resources/resources.qrc -o ui/resources_rc.py).
+# Importing the module registers the ":/" paths; without it files are read from disk.
+try:
+    from ui import resources_rc  # noqa: F401
+    _HAS_QRC = True
+except ImportError:
+    _HAS_QRC = False
 
-    from .pages.finish_page import FinishPage
 
-PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-RESOURCE_DIR = os.path.join(PROJECT_ROOT, "resources")
-ICON_DIR = os.path.join(RESOURCE_DIR, "icons")
-STYLE_PATH = os.path.join(RESOURCE_DIR, "style.qss")
-ICON_PATH = os.path.join(ICON_DIR, "app_icon.svg")
+_IS_MAC = sys.platform.startswith('darwin')
+# Linux session without an X11 or Wayland display (CI, ssh)
+_HEADLESS = sys.platform.startswith('linux') and not (
+    os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY')
+)
+# Sidebar layout (left, top, right, bottom) margins and spacing: roomier on macOS
+_SIDEBAR_MARGINS = (10, 18, 0, 18) if _IS_MAC else (10, 16, 0, 16)
+_SIDEBAR_SPACING = 10 if _IS_MAC else 12
+
+
+# Initial sidebar titles; set_steps_for_target replaces them with the target's steps
+_STEP_TITLES = (
+    "Import File",
+    "Authorize",
+    "Select Budget\nand Account",
+    "Transactions",
+    "Review",
+    "Finish",
+)
+
+# Export target -> sidebar steps as (page index, title)
+_STEP_MAPPINGS = {
+    'YNAB': (
+        (0, "Attach a file"),
+        (1, "Verify token"),
+        (2, "Select\nBudget and\naccount"),
+        (3, "Check latest\ntransactions"),
+        (4, "Choose what\nto import or\nskip"),
+        (5, "Finish"),
+    ),
+    'ACTUAL_API': (
+        (0, "Attach a file"),
+        (1, "Verify server\nURL and\npassword"),
+        (2, "Select\nBudget and\naccount"),
+        (3, "Check latest\ntransactions"),
+        (4, "Choose what\nto import or\nskip"),
+        (5, "Finish"),
+    ),
+    'FILE': (
+        (0, "Attach a file"),
+        (4, "Choose what\nto import or\nskip"),
+        (5, "Finish"),
+    ),
+}
+
+
+# Stack slot -> (module under ui.pages, page class, whether it takes the controller)
+_PAGE_SPECS = (
+    ("import_file", "ImportFilePage", True),
+    ("auth", "YNABAuthPage", True),
+    ("account_select", "AccountSelectionPage", True),
+    ("transactions", "TransactionsPage", True),
+    ("review_upload", "ReviewAndUploadPage", True),
+    ("finish_page", "FinishPage", False),
+    # Actual auth page is reachable for navigation, though not part of linear order
+    ("actual_auth", "ActualAuthPage", True),
+)
+
+
+def _page_class(module: str, name: str):
+    """Import ui.pages.<module> on first use and return the named page class."""
+    return getattr(importlib.import_module(f"ui.pages.{module}"), name)
+
+
+def _preload_page_modules():
+    """Import the page modules on a background thread so later page builds find them loaded."""
+    def _import_all():
+        for module, _, _ in _PAGE_SPECS:
+            try:
+                importlib.import_module(f"ui.pages.{module}")
+            except Exception as e:
+                logger.debug("[Wizard] Preloading ui.pages.%s failed: %s", module, e)
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-preload")
+    executor.submit(_import_all)
+    executor.shutdown(wait=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _project_root() -> str:
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def _resource_dir() -> str:
+    return os.path.join(_project_root(), "resources")
+
+
+@functools.lru_cache(maxsize=None)
+def _style_path() -> str:
+    if _HAS_QRC:
+        return ":/style.qss"
+    return os.path.join(_resource_dir(), "style.qss")
+
+
+@functools.lru_cache(maxsize=None)
+def _icon_path() -> str:
+    if _HAS_QRC:
+        return ":/icons/app_icon.svg"
+    return os.path.join(_resource_dir(), "icons", "app_icon.svg")
+
+
+@functools.lru_cache(maxsize=None)
+def _default_font() -> QFont:
+    """Shared UI font: system font on macOS, Segoe UI elsewhere.
+
+    Built on first use because a QFont needs a QGuiApplication to exist.
+    """
+    if _IS_MAC:
+        return QFont(".AppleSystemUIFont", 13)
+    # Replace San Francisco with Segoe UI
+    return QFont("Segoe UI", 13)
+
+
+# (mtime_ns, compacted text) of the last style.qss read in this process
+_STYLE_CACHE = None
+# Bump when _compact_qss output changes so existing style.qss.cache sidecars are rebuilt
+_STYLE_CACHE_VERSION = 1
+
+_QSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_QSS_SPACE_RE = re.compile(r"\s+")
+_QSS_PUNCT_SPACE_RE = re.compile(r"\s*([{};])\s*")
 
 
 class StepLabel(QLabel):
@@ -62,36 +175,30 @@ class StepLabel(QLabel):
 
     def __init__(self, text: str):
         super().__init__(text)
-        self.setWordWrap(True)
+        # No word wrap: step titles carry their own line breaks for the fixed-width sidebar
         self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
         self.setContentsMargins(0, 4, 0, 4)
         # Show hand cursor for clickable items
         self.setCursor(Qt.PointingHandCursor)
 
-        # Use system font on macOS
-        if sys.platform.startswith('darwin'):
-            self.setFont(QFont(".AppleSystemUIFont", 13))
-        else:
-            # Replace San Francisco with Segoe UI
-            self.setFont(QFont("Segoe UI", 13))
+        self.setFont(_default_font())
 
         # Store index for navigation
         self.step_index = -1
+        # Appearance comes from the QLabel[cssClass="step"] rules in style.qss
+        self.setProperty("cssClass", "step")
+        self._selected = None
         self.set_selected(False)
 
     def set_selected(self, selected: bool):
-        if selected:
-            # Use more prominent styling for selected step
-            self.setStyleSheet(
-                "background-color:#0066cc;color:white;border-radius:6px;"
-                "padding:8px 16px;font-size:13pt;font-weight:bold;"
-                "margin:2px 0px;border-left:4px solid #0066cc;"
-            )
-        else:
-            self.setStyleSheet(
-                "color:#333;padding:8px 16px;font-size:13pt;margin:2px 0px;"
-                "border-left:4px solid transparent;"
-            )
+        selected = bool(selected)
+        if selected == self._selected:
+            return
+        self._selected = selected
+        self.setProperty("selected", selected)
+        # Re-evaluate the property selectors against the app stylesheet
+        self.style().unpolish(self)
+        self.style().polish(self)
 
     def mousePressEvent(self, event):
         # Notify parent window to navigate to this step
@@ -111,9 +218,6 @@ class MacOSProxyStyle(QProxyStyle):
     def __init__(self):
         super().__init__(QStyleFactory.create("Fusion"))
 
-    def drawControl(self, element, option, painter, widget=None):
-        super().drawControl(element, option, painter, widget)
-
     def pixelMetric(self, metric, option=None, widget=None):
         # Adjust spacing for macOS
         if metric in (self.PM_ButtonMargin, self.PM_LayoutHorizontalSpacing):
@@ -122,96 +226,72 @@ class MacOSProxyStyle(QProxyStyle):
 
 
 class RobustWizard(QWizard):
-    def closeEvent(self, event):
-        logging.info(
-            "[Wizard] closeEvent triggered. Attempting to stop all worker threads..."
-        )
-        try:
-            for page_id in self.pageIds():
-                page = self.page(page_id)
-                if page is None:
-                    continue
-                logging.debug("[Wizard] Checking page id %s: %s", page_id, type(page).__name__)
-                for attr in ("worker", "review_upload_worker"):
-                    worker = getattr(page, attr, None)
-                    if worker is not None:
-                        logging.debug(
-                            "[Wizard] Found worker attribute '%s' on page id %s.",
-                            attr,
-                            page_id,
-                        )
-                        if hasattr(worker, 'isRunning'):
-                            logging.debug("[Wizard] Worker is running: %s", worker.isRunning())
-                            if worker.isRunning():
-                                logging.info(
-                                    "[Thread] Stopping %s thread on page id %s...",
-                                    attr,
-                                    page_id,
-                                )
-                                worker.quit()
-                                worker.wait(2000)
-        except Exception as e:
-            logging.exception("[Thread] Exception while stopping threads: %s", e)
-            traceback.print_exc()
-        super().closeEvent(event)
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Page id -> following page id, rebuilt after pages are added or removed
+        self._next_ids = None
+        self.pageAdded.connect(self._reset_next_ids)
+        self.pageRemoved.connect(self._reset_next_ids)
 
     def initializePage(self, id):
-        logging.debug(
-            "[Wizard] initializePage called for page id %s (%s)",
-            id,
-            type(self.page(id)).__name__,
-        )
+        # The page lookup only happens when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[Wizard] initializePage called for page id %s (%s)",
+                id,
+                type(self.page(id)).__name__,
+            )
         super().initializePage(id)
 
+    def _reset_next_ids(self, _page_id):
+        self._next_ids = None
+
     def nextId(self):
-        # Custom nextId logic to ensure finish page is shown after ReviewAndUploadPage
-        current_id = self.currentId()
-        # Assuming page IDs are added in order:
-        # 0=Import, 1=Auth, 2=Account, 3=Transactions, 4=Review, 5=Finish
-        if current_id == 4:
-            return 5  # Go to FinishPage
-        return super().nextId()
+        # Pages run in id order, so Review (4) is followed by Finish (5) and the
+        # last page has no successor
+        if self._next_ids is None:
+            ids = self.pageIds()
+            self._next_ids = dict(zip(ids[:-1], ids[1:]))
+        return self._next_ids.get(self.currentId(), -1)
 
 
 class SidebarWizardWindow(QMainWindow):
     """Custom wizard window with navigation sidebar and stacked widget content."""
 
+    # Named pages are built on first access (see _page)
+    import_page = property(lambda self: self._page(0))
+    auth_page = property(lambda self: self._page(1))
+    account_page = property(lambda self: self._page(2))
+    transactions_page = property(lambda self: self._page(3))
+    review_page = property(lambda self: self._page(4))
+    finish_page = property(lambda self: self._page(5))
+    actual_auth_page = property(lambda self: self._page(6))
+
     def __init__(self):
         super().__init__()
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.setWindowTitle("NBG/Revolut to YNAB Wizard")
 
-        # Use dimensions that fit content properly while allowing resize
-        self.setMinimumSize(960, 600)
-
         # Create single widget with no borders or spacing
         central = QWidget()
-        central.setStyleSheet("QWidget { border: none; }")  # Ensure no borders anywhere
+        # Borders inside the window are removed by the #central rules in style.qss
+        central.setObjectName("central")
         main_layout = QHBoxLayout(central)
         main_layout.setContentsMargins(0, 0, 0, 0)  # No margins
         main_layout.setSpacing(0)  # No spacing between widgets
 
         # Setup sidebar with step indicators
-        step_titles = [
-            "Import File",
-            "Authorize",
-            "Select Budget\nand Account",
-            "Transactions",
-            "Review",
-            "Finish",
-        ]
         self.step_labels = []
+        # Page index currently highlighted and the labels that highlight it
+        self._current_step = -1
+        self._labels_by_step = {}
         sidebar_layout = QVBoxLayout()
 
         # Use macOS-style margins and spacing
-        if sys.platform.startswith('darwin'):
-            sidebar_layout.setContentsMargins(10, 18, 0, 18)
-            sidebar_layout.setSpacing(10)
-        else:
-            sidebar_layout.setContentsMargins(10, 16, 0, 16)
-            sidebar_layout.setSpacing(12)
-
-        for i, t in enumerate(step_titles):
+        sidebar_layout.setContentsMargins(*_SIDEBAR_MARGINS)
+        sidebar_layout.setSpacing(_SIDEBAR_SPACING)
+
+        for i, t in enumerate(_STEP_TITLES):
             lbl = StepLabel(t)
             lbl.step_index = i  # Store the index for navigation
             self.step_labels.append(lbl)
@@ -222,8 +302,8 @@ class SidebarWizardWindow(QMainWindow):
         side_widget.setLayout(sidebar_layout)
 
         # Use consistent styling for sidebar - fixed width
+        side_widget.setObjectName("sidebar")
         side_widget.setFixedWidth(180)
-        side_widget.setStyleSheet("background-color: #F7F8FA;")  # Light gray background
 
         # Add sidebar to main layout
         main_layout.addWidget(side_widget)
@@ -233,9 +313,6 @@ class SidebarWizardWindow(QMainWindow):
         content_layout = QVBoxLayout(content_widget)
         content_layout.setContentsMargins(0, 0, 0, 0)  # No margins
 
-        # Create controller for business logic
-        self.controller = WizardController()
-
         # Create a container for the pages and navigation buttons
         page_container = QWidget()
         page_container_layout = QVBoxLayout(page_container)
@@ -259,6 +336,8 @@ class SidebarWizardWindow(QMainWindow):
         self.back_button.setFixedWidth(120)
         self.back_button.setFixedHeight(40)
         self.back_button.clicked.connect(self.go_back)
+        # Slot currently wired to back_button (Exit on the first page, Back elsewhere)
+        self._back_target = self.go_back
         nav_button_layout.addWidget(self.back_button)
 
         # Add spacer to push buttons to sides
@@ -277,7 +356,6 @@ class SidebarWizardWindow(QMainWindow):
         separator.setFrameShape(QFrame.HLine)
         separator.setFrameShadow(QFrame.Sunken)
         separator.setObjectName("nav-separator")
-        separator.setStyleSheet("background-color: #E1E3E5; max-height: 1px;")
         page_container_layout.addWidget(separator)
 
         # Add buttons to page container layout
@@ -286,31 +364,60 @@ class SidebarWizardWindow(QMainWindow):
         # Add page container to content layout
         content_layout.addWidget(page_container)
 
-        # Create all pages (original pages from QWizard)
-        self.import_page = ImportFilePage(self.controller)
-        self.auth_page = YNABAuthPage(self.controller)
-        self.actual_auth_page = ActualAuthPage(self.controller)
-        self.account_page = AccountSelectionPage(self.controller)
-        self.transactions_page = TransactionsPage(self.controller)
-        self.review_page = ReviewAndUploadPage(self.controller)
-        self.finish_page = FinishPage()
-
-        # Add pages to stacked widget
-        self.pages_stack.addWidget(self.import_page)
-        self.pages_stack.addWidget(self.auth_page)
-        self.pages_stack.addWidget(self.account_page)
-        self.pages_stack.addWidget(self.transactions_page)
-        self.pages_stack.addWidget(self.review_page)
-        self.pages_stack.addWidget(self.finish_page)
-        # Include Actual auth page in stack for navigation, though not part of linear order
-        self.pages_stack.addWidget(self.actual_auth_page)
-
-        # Connect page signals - ensure all pages emit completeChanged signal
-        # Create an empty signal handler for pages that might not have completeChanged yet
-        for i in range(self.pages_stack.count()):
-            page = self.pages_stack.widget(i)
+        # Pages are built from _PAGE_SPECS on first navigation; until then each
+        # slot holds an empty placeholder widget.
+        self._pages = [None] * len(_PAGE_SPECS)
+        for _ in _PAGE_SPECS:
+            self.pages_stack.addWidget(QWidget())
+
+        self._last_page = self.pages_stack.count() - 1
+        # Stack indices whose initializePage has already run
+        self._initialized_pages = set()
+        # Last (index, complete, back visible, next text) applied by update_nav_buttons
+        self._nav_state = None
+
+        # Bursts of completeChanged collapse into one nav update per event-loop pass
+        self._nav_update_timer = QTimer(self)
+        self._nav_update_timer.setSingleShot(True)
+        self._nav_update_timer.setInterval(0)
+        self._nav_update_timer.timeout.connect(self.update_nav_buttons)
+
+        # Only the first page is needed for the first paint
+        self._page(0)
+
+        # Add content widget to main layout
+        main_layout.addWidget(content_widget, 1)  # Stretch factor of 1
+
+        self.setCentralWidget(central)
+
+        # Initialize steps for default target and start on the first page
+        self.set_steps_for_target(self.controller.export_target)
+        self.go_to_page(0)
+
+        # Size constraint last, once the whole tree exists, so layout runs in one pass.
+        # Use dimensions that fit content properly while allowing resize
+        self.setMinimumSize(960, 600)
+
+    @functools.cached_property
+    def controller(self):
+        """Business-logic controller, created on first access."""
+        return WizardController()
+
+    def _page(self, index: int):
+        """Return the page in stack slot index, building it on first use."""
+        page = self._pages[index]
+        if page is None:
+            module, name, takes_controller = _PAGE_SPECS[index]
+            page_class = _page_class(module, name)
+            page = page_class(self.controller) if takes_controller else page_class()
+            stack = self.pages_stack
+            placeholder = stack.widget(index)
+            stack.insertWidget(index, page)
+            stack.removeWidget(placeholder)
+            placeholder.deleteLater()
+            self._pages[index] = page
             try:
-                page.completeChanged.connect(self.update_nav_buttons)
+                page.completeChanged.connect(self._schedule_nav_update, Qt.UniqueConnection)
                 self.logger.debug(
                     "[SidebarWizardWindow] Connected completeChanged for %s",
                     type(page).__name__,
@@ -321,24 +428,15 @@ class SidebarWizardWindow(QMainWindow):
                     type(page).__name__,
                     e,
                 )
+        return page
 
-        # Add extra safety to connect specific pages we know should have the signal
-        for page in [self.import_page, self.auth_page, self.account_page,
-                     self.transactions_page, self.review_page, self.finish_page]:
-            try:
-                if not page.receivers(page.completeChanged):
-                    page.completeChanged.connect(self.update_nav_buttons)
-            except (AttributeError, TypeError):
-                pass
-
-        # Add content widget to main layout
-        main_layout.addWidget(content_widget, 1)  # Stretch factor of 1
-
-        self.setCentralWidget(central)
-
-        # Initialize steps for default target and start on the first page
-        self.set_steps_for_target(self.controller.export_target)
-        self.go_to_page(0)
+    def closeEvent(self, event):
+        # The controller owns the only worker thread; stop it before Qt tears it down
+        try:
+            self.controller.shutdown()
+        except Exception as e:
+            self.logger.exception("[Thread] Exception while stopping threads: %s", e)
+        super().closeEvent(event)
 
     def update_sidebar(self, step: int):
         """Highlight the current step label.
@@ -348,39 +446,23 @@ class SidebarWizardWindow(QMainWindow):
         also consider the label's position to match the current page index. This
         keeps default YNAB mapping intuitive and satisfies tests that check by
         order while still working when labels are remapped for other targets.
+
+        Only the labels of the previous and the new step are touched; the
+        lookup table is rebuilt by set_steps_for_target.
         """
-        for idx, lbl in enumerate(self.step_labels):
-            if not lbl.isVisible():
-                continue
-            lbl.set_selected((lbl.step_index == step) or (idx == step))
+        if step == self._current_step:
+            return
+        for lbl in self._labels_by_step.get(self._current_step, ()):
+            lbl.set_selected(False)
+        for lbl in self._labels_by_step.get(step, ()):
+            lbl.set_selected(True)
+        self._current_step = step
 
     def set_steps_for_target(self, target: str):
         target = (target or 'YNAB').upper()
-        self.logger.info("[Wizard] set_steps_for_target: %s", target)
-        # Default mapping for YNAB
-        mapping = [
-            (0, "Attach a file"),
-            (1, "Verify token"),
-            (2, "Select Budget and account"),
-            (3, "Check latest transactions"),
-            (4, "Choose what to import or skip"),
-            (5, "Finish"),
-        ]
-        if target == 'ACTUAL_API':
-            mapping = [
-                (0, "Attach a file"),
-                (1, "Verify server URL and password"),
-                (2, "Select Budget and account"),
-                (3, "Check latest transactions"),
-                (4, "Choose what to import or skip"),
-                (5, "Finish"),
-            ]
-        elif target == 'FILE':
-            mapping = [
-                (0, "Attach a file"),
-                (4, "Choose what to import or skip"),
-                (5, "Finish"),
-            ]
+        self.logger.debug("[Wizard] set_steps_for_target: %s", target)
+        # Unknown targets (including 'ACTUAL') use the YNAB steps
+        mapping = _STEP_MAPPINGS.get(target, _STEP_MAPPINGS['YNAB'])
 
         # Apply mapping to labels
         for i, lbl in enumerate(self.step_labels):
@@ -392,12 +474,25 @@ class SidebarWizardWindow(QMainWindow):
             else:
                 lbl.step_index = -1
                 lbl.hide()
+
+        # Map page index -> labels to highlight (by step_index, then by position)
+        labels_by_step = {}
+        for idx, lbl in enumerate(self.step_labels):
+            lbl.set_selected(False)
+            if lbl.step_index < 0:
+                continue
+            labels_by_step.setdefault(lbl.step_index, []).append(lbl)
+            if idx != lbl.step_index:
+                labels_by_step.setdefault(idx, []).append(lbl)
+        self._labels_by_step = labels_by_step
+        self._current_step = -1
+
         # Refresh selection
         self.update_sidebar(self.pages_stack.currentIndex())
 
         # Keep Import page radio buttons in sync as well
         try:
-            if hasattr(self, 'import_page') and self.import_page is not None:
+            if self._pages[0] is not None:
                 if target == 'YNAB' and hasattr(self.import_page, 'rb_ynab'):
                     self.import_page.rb_ynab.setChecked(True)
                 elif target == 'ACTUAL_API' and hasattr(self.import_page, 'rb_actual'):
@@ -423,243 +518,305 @@ class SidebarWizardWindow(QMainWindow):
                     self.update_nav_buttons()
                     return
             # Route Authorize step to Actual auth when selected
-            if (
-                index == 1
-                and getattr(self.controller, 'export_target', 'YNAB') == 'ACTUAL_API'
-                and getattr(self, 'actual_auth_page', None) is not None
-            ):
-                page = self.actual_auth_page
-                if hasattr(page, 'initializePage'):
-                    page.initializePage()
-                self.pages_stack.setCurrentWidget(page)
-                self.update_sidebar(index)
-                self.update_nav_buttons()
+            if index == 1 and getattr(self.controller, 'export_target', 'YNAB') == 'ACTUAL_API':
+                self._show_actual_auth()
                 return
 
-            if index < self.pages_stack.count():
-                # Call initialize on the page we're going to if available
-                page = self.pages_stack.widget(index)
-                if hasattr(page, 'initializePage'):
+            stack = self.pages_stack
+            if index < stack.count():
+                # Initialize on first visit; pages that depend on earlier steps opt in to
+                # re-initialization through needs_reinit
+                page = self._page(index)
+                if index not in self._initialized_pages or getattr(page, 'needs_reinit', False):
                     page.initializePage()
+                    self._initialized_pages.add(index)
 
                 # Switch to the page
-                self.pages_stack.setCurrentIndex(index)
+                stack.setCurrentIndex(index)
 
                 # Update sidebar
                 self.update_sidebar(index)
-                # Defensive: enforce selection in case any visibility/mapping issues prevent highlight
-                try:
-                    for idx, lbl in enumerate(self.step_labels):
-                        lbl.set_selected((getattr(lbl, 'step_index', -1) == index) or (idx == index))
-                except Exception:
-                    pass
 
                 # Update navigation button states
                 self.update_nav_buttons()
 
+    def _show_actual_auth(self):
+        """Show the Actual auth page while keeping the sidebar on step 1."""
+        page = self.actual_auth_page
+        page.initializePage()
+        self.pages_stack.setCurrentWidget(page)
+        self.update_sidebar(1)
+        self.update_nav_buttons()
+
     def go_back(self):
         """Go to the previous page"""
+        stack = self.pages_stack
         # Special-case: if on Actual auth page, go back to Import (logical step 0)
-        if self.pages_stack.currentWidget() is getattr(self, 'actual_auth_page', None):
+        if stack.currentWidget() is self._pages[6]:
             self.go_to_page(0)
             return
-        current = self.pages_stack.currentIndex()
+        current = stack.currentIndex()
         if current > 0:
             self.go_to_page(current - 1)
 
     def go_forward(self):
         """Go to the next page"""
-        current = self.pages_stack.currentIndex()
-        if current < self.pages_stack.count() - 1:
-            # Get current page
-            page = self.pages_stack.currentWidget()
-
+        stack = self.pages_stack
+        current = stack.currentIndex()
+        page = stack.currentWidget()
+        last = self._last_page
+        if current < last:
             # Check if page is complete before proceeding
-            if hasattr(page, 'isComplete') and not page.isComplete():
+            if not page.isComplete():
                 self.logger.info(
                     "[SidebarWizardWindow] Page %s is not complete, cannot proceed",
                     current,
                 )
                 return
 
-            # Check if page has a validate_and_proceed method
-            if hasattr(page, 'validate_and_proceed'):
-                self.logger.debug(
-                    "[SidebarWizardWindow] Using validate_and_proceed for page %s",
-                    current,
-                )
-                result = page.validate_and_proceed()
-                if not result:
-                    self.logger.info(
-                        "[SidebarWizardWindow] validate_and_proceed returned False for page %s",
-                        current,
-                    )
-            else:
-                # If no validation needed, proceed to next page, with special handling for Actual export
-                self.logger.debug(
-                    "[SidebarWizardWindow] No validate_and_proceed method for page %s, proceeding",
+            # Pages validate their input and navigate on success
+            self.logger.debug(
+                "[SidebarWizardWindow] Using validate_and_proceed for page %s",
+                current,
+            )
+            if not page.validate_and_proceed():
+                self.logger.info(
+                    "[SidebarWizardWindow] validate_and_proceed returned False for page %s",
                     current,
                 )
-                # If leaving Import page and target is Actual API, go to Actual auth page and keep sidebar on step 1
-                if current == 0 and getattr(self.controller, 'export_target', 'YNAB') == 'ACTUAL_API':
-                    if hasattr(self, 'actual_auth_page') and self.actual_auth_page is not None:
-                        page = self.actual_auth_page
-                        if hasattr(page, 'initializePage'):
-                            page.initializePage()
-                        self.pages_stack.setCurrentWidget(page)
-                        self.update_sidebar(1)
-                        self.update_nav_buttons()
-                    else:
-                        # Fallback to standard auth page if Actual page is unavailable
-                        self.go_to_page(1)
-                elif current == 0 and getattr(self.controller, 'export_target', 'YNAB') == 'FILE':
-                    # Jump directly to review/selection step for File Converter
-                    self.go_to_page(4)
-                else:
-                    self.go_to_page(current + 1)
-        elif current == self.pages_stack.count() - 1:
-            # On the last page, check if we should close the app
-            page = self.pages_stack.currentWidget()
-            if hasattr(page, 'validate_and_proceed'):
-                self.logger.debug("[SidebarWizardWindow] Calling validate_and_proceed on final page")
-                page.validate_and_proceed()
-            else:
-                self.logger.info("[SidebarWizardWindow] Closing application from final page")
-                self.close()
+        elif current == last:
+            self.logger.debug("[SidebarWizardWindow] Calling validate_and_proceed on final page")
+            page.validate_and_proceed()
+
+    def _schedule_nav_update(self):
+        """Queue update_nav_buttons; repeated calls before it runs are coalesced."""
+        if not self._nav_update_timer.isActive():
+            self._nav_update_timer.start()
 
     def update_nav_buttons(self):
         """Update navigation buttons based on current page"""
-        current = self.pages_stack.currentIndex()
+        stack = self.pages_stack
+        current = stack.currentIndex()
+        page = stack.currentWidget()
+
+        # The current page's isComplete decides whether next is enabled
+        try:
+            is_complete = bool(page.isComplete())
+            self.logger.debug(
+                "[SidebarWizardWindow] Page %s isComplete: %s",
+                current,
+                is_complete,
+            )
+        except Exception as e:
+            self.logger.debug(
+                "[SidebarWizardWindow] Error checking isComplete: %s",
+                e,
+            )
+            is_complete = False
+
+        # Hide back button on last page
+        back_visible = current != self._last_page
+        # Next button text: default Continue, Exit only on FinishPage
+        next_text = "Exit" if page is self._pages[5] else "Continue"
+
+        # Nothing to do if the state is unchanged and no page has touched the buttons
+        state = (current, is_complete, back_visible, next_text)
+        if (
+            state == self._nav_state
+            and self.next_button.isEnabled() == is_complete
+            and self.next_button.text() == next_text
+            and self.back_button.isHidden() != back_visible
+        ):
+            return
+        self._nav_state = state
 
         # First page has Exit button instead of Back
-        if current == 0:
-            self.back_button.setText("Exit")
-            self.back_button.setEnabled(True)
+        self.back_button.setText("Exit" if current == 0 else "Back")
+        self.back_button.setEnabled(True)
+        back_target = self.close if current == 0 else self.go_back
+        # Bound methods are recreated on access, so compare by equality
+        if back_target != self._back_target:
             try:
                 self.back_button.clicked.disconnect()
-            except Exception as e:
-                self.logger.debug(
-                    "[SidebarWizardWindow] Error disconnecting back button: %s",
-                    e,
-                )
-                pass
-            self.back_button.clicked.connect(self.close)
-        else:
-            self.back_button.setText("Back")
-            self.back_button.setEnabled(True)
-            try:
-                self.back_button.clicked.disconnect()
-            except Exception as e:
+            except TypeError as e:
                 self.logger.debug(
                     "[SidebarWizardWindow] Error disconnecting back button: %s",
                     e,
                 )
-                pass
-            self.back_button.clicked.connect(self.go_back)
+            self.back_button.clicked.connect(back_target)
+            self._back_target = back_target
+        self.back_button.setVisible(back_visible)
 
-        # Hide back button on last page
-        if current == self.pages_stack.count() - 1:
-            self.back_button.hide()
-        else:
-            self.back_button.show()
+        self.next_button.setText(next_text)
+        self.next_button.setEnabled(is_complete)
 
-        # Next button text: default Continue, Exit only on FinishPage
-        page = self.pages_stack.currentWidget()
-        is_finish_page = hasattr(page, "__class__") and page.__class__.__name__ == "FinishPage"
-        if is_finish_page:
-            self.next_button.setText("Exit")
-        else:
-            self.next_button.setText("Continue")
-
-        # Check if current page has isComplete method to determine if next is enabled
-        page = self.pages_stack.currentWidget()
-        if hasattr(page, 'isComplete'):
-            try:
-                is_complete = page.isComplete()
-                self.next_button.setEnabled(is_complete)
-                self.logger.debug(
-                    "[SidebarWizardWindow] Page %s isComplete: %s",
-                    current,
-                    is_complete,
-                )
-            except Exception as e:
-                self.logger.debug(
-                    "[SidebarWizardWindow] Error checking isComplete: %s",
-                    e,
-                )
-                self.next_button.setEnabled(False)
-        else:
-            self.logger.debug(
-                "[SidebarWizardWindow] Page %s has no isComplete method",
-                current,
-            )
-            self.next_button.setEnabled(True)
 
+@functools.lru_cache(maxsize=None)
+def _style_cache_path() -> str:
+    return str(CACHE_DIR / "style.qss.cache")
 
-def load_style(app: QApplication):
-    """Load QSS and apply a macOS-native palette."""
-    # Load stylesheets
-    if os.path.exists(STYLE_PATH):
+
+def _compact_qss(text: str) -> str:
+    """Strip comments and redundant whitespace so Qt tokenizes a smaller sheet."""
+    text = _QSS_COMMENT_RE.sub("", text)
+    text = _QSS_SPACE_RE.sub(" ", text)
+    return _QSS_PUNCT_SPACE_RE.sub(r"\1", text).strip()
+
+
+def _read_qss_source(style_path: str) -> str:
+    qss_file = QFile(style_path)
+    if not qss_file.open(QFile.ReadOnly):
+        raise OSError(qss_file.errorString())
+    try:
+        return bytes(qss_file.readAll()).decode("utf-8")
+    finally:
+        qss_file.close()
+
+
+def _style_cache_header(mtime_ns: int) -> bytes:
+    return f"v{_STYLE_CACHE_VERSION}:{mtime_ns}".encode("ascii")
+
+
+def _load_style_cache(mtime_ns: int):
+    """Return the cached compacted QSS if it was built from this mtime and format, else None."""
+    try:
+        with open(_style_cache_path(), "rb") as f:
+            header, _, body = f.read().partition(b"\n")
+    except OSError:
+        return None
+    if header.strip() != _style_cache_header(mtime_ns):
+        return None
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _save_style_cache(mtime_ns: int, text: str):
+    """Best-effort write of the compacted QSS sidecar (first line holds format version and source mtime)."""
+    cache_path = _style_cache_path()
+    tmp_path = cache_path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            f.write(_style_cache_header(mtime_ns) + b"\n" + text.encode("utf-8"))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("[QSS] Could not write style cache %s: %s", cache_path, e)
+
+
+def _read_style() -> str:
+    """Return the compacted stylesheet, from memory or the on-disk cache when unchanged."""
+    global _STYLE_CACHE
+    style_path = _style_path()
+    # Compiled resources cannot change while the process runs
+    mtime_ns = 0 if _HAS_QRC else os.stat(style_path).st_mtime_ns
+    if _STYLE_CACHE is not None and _STYLE_CACHE[0] == mtime_ns:
+        return _STYLE_CACHE[1]
+    text = None if _HAS_QRC else _load_style_cache(mtime_ns)
+    if text is None:
+        text = _compact_qss(_read_qss_source(style_path))
+        if not _HAS_QRC:
+            _save_style_cache(mtime_ns, text)
+    _STYLE_CACHE = (mtime_ns, text)
+    return text
+
+
+def apply_stylesheet(app: QApplication):
+    """Load style.qss and apply it application-wide."""
+    style_path = _style_path()
+    if QFile.exists(style_path):
         try:
-            with open(STYLE_PATH, "r") as f:
-                app.setStyleSheet(f.read())
-            logging.info("[QSS] Loaded style from %s", STYLE_PATH)
+            app.setStyleSheet(_read_style())
+            logger.debug("[QSS] Loaded style from %s", style_path)
         except Exception as e:
-            logging.warning("[QSS] Failed to load style.qss: %s", e)
+            logger.warning("[QSS] Failed to load style.qss: %s", e)
     else:
-        logging.warning("[QSS] style.qss not found at %s. UI will use default style.", STYLE_PATH)
+        logger.warning("[QSS] style.qss not found at %s. UI will use default style.", style_path)
+
+
+# (role, color) pairs applied by load_palette
+_MAC_PALETTE = (
+    (QPalette.Window, "#F5F5F7"),
+    (QPalette.WindowText, "#1D1D1F"),
+    (QPalette.Base, "#FFFFFF"),
+    (QPalette.Button, "#F5F5F7"),
+    (QPalette.Text, "#1D1D1F"),
+    (QPalette.ButtonText, "#1D1D1F"),
+    (QPalette.Highlight, "#0071E3"),
+)
+_LIGHT_PALETTE = (
+    (QPalette.Window, "#F7F7F7"),
+    (QPalette.WindowText, "#000000"),
+    (QPalette.Base, "#FFFFFF"),
+    (QPalette.Button, "#FFFFFF"),
+    (QPalette.Text, "#000000"),
+    (QPalette.ButtonText, "#000000"),
+)
+
+
+def load_palette(app: QApplication, skip_cosmetics: bool = False):
+    """Apply the app icon, font, style and a macOS-native palette (no QSS).
+
+    With skip_cosmetics (headless runs) only the font is set, since it affects
+    layout; icon, widget style and palette are never seen offscreen.
+    """
+    app.setFont(_default_font())
+    if skip_cosmetics:
+        return
 
     # Load and set app icon
-    if os.path.exists(ICON_PATH):
+    icon_path = _icon_path()
+    if QFile.exists(icon_path):
         try:
-            renderer = QSvgRenderer(ICON_PATH)
-            pixmap = QPixmap(128, 128)
-            pixmap.fill(Qt.transparent)
-            painter = QPainter(pixmap)
-            renderer.render(painter)
-            painter.end()
-            app.setWindowIcon(QIcon(pixmap))
-            logging.info("[Icon] Loaded app icon from %s", ICON_PATH)
+            # The SVG icon engine rasterizes lazily for each requested size
+            app.setWindowIcon(QIcon(icon_path))
+            logger.debug("[Icon] Loaded app icon from %s", icon_path)
         except Exception as e:
-            logging.warning("[Icon] Failed to load app_icon.svg: %s", e)
+            logger.warning("[Icon] Failed to load app_icon.svg: %s", e)
     else:
-        logging.warning("[Icon] app_icon.svg not found at %s. Using default icon.", ICON_PATH)
+        logger.warning("[Icon] app_icon.svg not found at %s. Using default icon.", icon_path)
 
     # Setup platform-specific style
-    # Use system font on macOS
-    if sys.platform.startswith('darwin'):
-        # Try to load system font
-        system_font = QFont(".AppleSystemUIFont", 13)
-        app.setFont(system_font)
-
+    if _IS_MAC:
         # Apply macOS style proxy for better native feel
         app.setStyle(MacOSProxyStyle())
 
         # Use more macOS-like palette (subtle colors)
-        pal = app.palette()
-        pal.setColor(QPalette.Window, QColor("#F5F5F7"))
-        pal.setColor(QPalette.WindowText, QColor("#1D1D1F"))
-        pal.setColor(QPalette.Base, QColor("#FFFFFF"))
-        pal.setColor(QPalette.Button, QColor("#F5F5F7"))
-        pal.setColor(QPalette.Text, QColor("#1D1D1F"))
-        pal.setColor(QPalette.ButtonText, QColor("#1D1D1F"))
-        pal.setColor(QPalette.Highlight, QColor("#0071E3"))
-        app.setPalette(pal)
+        colors = _MAC_PALETTE
     else:
         # For other platforms use Fusion with light palette
         app.setStyle("Fusion")
-        app.setFont(QFont("Segoe UI", 13))  # Replace San Francisco with Segoe UI
-        pal = app.palette()
-        pal.setColor(QPalette.Window, QColor("#F7F7F7"))
-        pal.setColor(QPalette.WindowText, Qt.black)
-        pal.setColor(QPalette.Base, QColor("#FFFFFF"))
-        pal.setColor(QPalette.Button, QColor("#FFFFFF"))
-        pal.setColor(QPalette.Text, Qt.black)
-        pal.setColor(QPalette.ButtonText, Qt.black)
-        app.setPalette(pal)
+        colors = _LIGHT_PALETTE
+    # Fill a fresh palette and assign it once; roles left unset resolve from the style
+    pal = QPalette()
+    for role, color in colors:
+        pal.setColor(role, QColor(color))
+    app.setPalette(pal)
+
+
+def load_style(app: QApplication, skip_cosmetics: bool = False):
+    """Load QSS and apply a macOS-native palette."""
+    apply_stylesheet(app)
+    load_palette(app, skip_cosmetics)
+
+
+def _queue_root_logging() -> QueueListener:
+    """Put the root handlers behind a queue so the GUI thread only enqueues records.
+
+    Formatting and stream writes happen on the listener's thread; the caller
+    stops the returned listener to flush it on exit.
+    """
+    root = logging.getLogger()
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, *root.handlers, respect_handler_level=True)
+    root.handlers = [QueueHandler(records)]
+    listener.start()
+    return listener
 
 
 def main():
+    log_listener = None
     try:
         # Support a simple --debug flag for local runs
         debug_mode = False
@@ -671,7 +828,7 @@ def main():
         # Cleanup caches when in debug mode to avoid stale bytecode
         if debug_mode:
             try:
-                project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+                project_root = _project_root()
                 candidates = [
                     os.path.join(project_root, '__pycache__'),
                     os.path.join(project_root, '.pytest_cache'),
@@ -684,39 +841,55 @@ def main():
                 for path in candidates:
                     if os.path.isdir(path):
                         shutil.rmtree(path, ignore_errors=True)
-                logging.info('[Wizard] Debug mode: caches cleared')
+                logger.info('[Wizard] Debug mode: caches cleared')
             except Exception as e:
-                logging.warning("[Wizard] Debug mode cache cleanup error: %s", e)
-
-        # On Linux headless, use offscreen; skip on macOS
+                logger.warning("[Wizard] Debug mode cache cleanup error: %s", e)
 
-        if (sys.platform.startswith('linux') and
-            not os.environ.get('DISPLAY') and
-                not os.environ.get('WAYLAND_DISPLAY')):
-            os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+        # On Linux headless, use offscreen unless a platform was chosen explicitly
+        if _HEADLESS:
+            os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
 
-        # Configure logging level (DEBUG if --debug)
+        # Configure logging level (DEBUG if --debug, else $LOGLEVEL, default WARNING).
+        # force=True because service modules may already have configured the root logger.
+        log_level = os.environ.get("LOGLEVEL", "WARNING").upper()
+        if not isinstance(logging.getLevelName(log_level), int):
+            log_level = "WARNING"
         logging.basicConfig(
-            level=logging.DEBUG if debug_mode else logging.INFO,
-            format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+            level=logging.DEBUG if debug_mode else log_level,
+            format='%(asctime)s %(levelname)s %(name)s: %(message)s',
+            force=True,
         )
+        log_listener = _queue_root_logging()
 
+        # Must be set before the QApplication exists. High-DPI pixmaps keep icons rendered
+        # at the device pixel ratio instead of re-rasterizing on screen changes.
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
         app = QApplication(sys.argv)
 
         # Set object name for platform-specific styling in QSS
-        if sys.platform.startswith('darwin'):
+        if _IS_MAC:
             app.setObjectName("macOS")
             # Set macOS-specific attributes for better integration
             app.setAttribute(Qt.AA_DontShowIconsInMenus, True)
 
-        load_style(app)
+        # Palette first; the QSS is parsed once the first frame is on screen.
+        # The stylesheet is still applied offscreen since widget sizes depend on it.
+        headless = os.environ.get('QT_QPA_PLATFORM') == 'offscreen'
+        load_palette(app, skip_cosmetics=headless)
         window = SidebarWizardWindow()
         window.show()
-        logging.info("[Wizard] Wizard UI started. Entering event loop.")
+        QTimer.singleShot(0, lambda: apply_stylesheet(app))
+        _preload_page_modules()
+        logger.info("[Wizard] Wizard UI started. Entering event loop.")
         sys.exit(app.exec_())
     except Exception as e:
-        logging.exception("[Main] Exception in main(): %s", e)
-        traceback.print_exc()
+        logger.exception("[Main] Exception in main(): %s", e)
+    finally:
+        # Flush queued records (including a startup crash) before the process exits
+        if log_listener is not None:
+            log_listener.stop()
 
 
 if __name__ == "__main__":